@@ -11,6 +11,8 @@ import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from timing import span
+
 logger = logging.getLogger(__name__)
 
 CACHE_DIR = Path(__file__).parent / ".cache"
@@ -59,7 +61,7 @@ class ResponseCache:
             return None
 
         try:
-            with open(cache_path, 'r') as f:
+            with span("cache_read"), open(cache_path, 'r') as f:
                 cached = json.load(f)
 
             # Check TTL
@@ -98,7 +100,7 @@ class ResponseCache:
                 'key_data': key_data
             }
 
-            with open(cache_path, 'w') as f:
+            with span("cache_write"), open(cache_path, 'w') as f:
                 json.dump(cached, f)
 
             logger.info(f"Cached response for key {cache_key[:8]}... (TTL: {ttl}s)")
@@ -0,0 +1,252 @@
+"""
+Domain availability checking for Fission API
+Derives candidate domains for names and checks them concurrently
+"""
+
+import os
+import re
+import time
+import asyncio
+import logging
+import unicodedata
+from typing import Dict, Any, List, Optional, Iterable, AsyncIterator, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+TLDS = ["com", "io", "ai"]
+PREFIXES = ["get", "try"]
+DEFAULT_TTL = 6 * 3600  # 6 hours
+DEFAULT_CONCURRENCY = 20
+PRUNE_INTERVAL = 300  # Seconds between sweeps of expired cache entries
+MAX_NAMES = 200  # Names checked per batch; each fans out into 5-6 lookups
+DOH_URL = "https://cloudflare-dns.com/dns-query"
+
+
+def candidate_domains(name: str) -> List[str]:
+    """
+    Derive candidate domains for a name
+
+    Args:
+        name: Business name, e.g. "Nexus Labs"
+
+    Returns:
+        Domains such as nexuslabs.com, nexuslabs.io, nexuslabs.ai,
+        nexus-labs.com, getnexuslabs.com and trynexuslabs.com; empty if
+        the name has letters that can't be folded to ASCII
+    """
+    # Fold accents ("Brío" -> "Brio") rather than dropping the letters
+    folded = "".join(
+        c for c in unicodedata.normalize("NFKD", name) if not unicodedata.combining(c)
+    )
+    if any(c.isalnum() and not c.isascii() for c in folded):
+        return []
+
+    # Split on spaces/punctuation and camelCase boundaries
+    words = re.findall(r"[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])", folded)
+    words = [w.lower() for w in words]
+    if not words:
+        return []
+
+    slug = "".join(words)
+    domains = [f"{slug}.{tld}" for tld in TLDS]
+    if len(words) > 1:
+        domains.append(f"{'-'.join(words)}.com")
+    domains.extend(f"{prefix}{slug}.com" for prefix in PREFIXES)
+    return domains
+
+
+class StubResolver:
+    """Local resolver for tests: every domain is available unless listed as taken"""
+
+    def __init__(self, taken: Optional[Iterable[str]] = None):
+        self.taken = {d.lower() for d in taken or []}
+        self.calls = 0
+
+    async def is_available(self, domain: str) -> Optional[bool]:
+        self.calls += 1
+        return domain.lower() not in self.taken
+
+    async def close(self):
+        pass
+
+
+class DohResolver:
+    """
+    DNS-over-HTTPS resolver
+
+    A domain with no NS records (NXDOMAIN) is reported as available. This
+    is a fast heuristic, not a registrar lookup. Requests share one pooled
+    HTTP/1.1 keep-alive client.
+    """
+
+    def __init__(self, url: str = DOH_URL, max_connections: int = DEFAULT_CONCURRENCY):
+        self.url = url
+        self.max_connections = max_connections
+        self.client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Create the pooled client on first use (and again after close)"""
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                timeout=5.0,
+                headers={"accept": "application/dns-json"},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        return self.client
+
+    async def is_available(self, domain: str) -> Optional[bool]:
+        try:
+            response = await self._get_client().get(self.url, params={"name": domain, "type": "NS"})
+            response.raise_for_status()
+            status = response.json().get("Status")
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Domain lookup failed for {domain}: {e}")
+            return None
+
+        if status == 3:  # NXDOMAIN
+            return True
+        if status == 0:  # NOERROR
+            return False
+        return None
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.aclose()
+
+
+class DomainChecker:
+    """Concurrent domain checker with an in-memory TTL cache"""
+
+    def __init__(
+        self,
+        resolver: Any,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ttl: int = DEFAULT_TTL,
+        prune_interval: int = PRUNE_INTERVAL
+    ):
+        self.resolver = resolver
+        self.ttl = ttl
+        self.prune_interval = prune_interval
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._cache: Dict[str, Tuple[Optional[bool], float]] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._next_prune = time.time() + prune_interval
+
+    def _cached(self, domain: str) -> Tuple[bool, Optional[bool]]:
+        entry = self._cache.get(domain)
+        if entry and time.time() <= entry[1]:
+            return True, entry[0]
+        return False, None
+
+    def _prune(self):
+        """Drop expired entries, at most once per prune_interval"""
+        now = time.time()
+        if now < self._next_prune:
+            return
+        self._next_prune = now + self.prune_interval
+        expired = [d for d, (_, expires_at) in self._cache.items() if now > expires_at]
+        for domain in expired:
+            del self._cache[domain]
+
+    async def _lookup(self, domain: str) -> Optional[bool]:
+        async with self._semaphore:
+            available = await self.resolver.is_available(domain)
+        self._prune()
+        # Don't remember failed lookups for the full TTL
+        ttl = self.ttl if available is not None else 60
+        self._cache[domain] = (available, time.time() + ttl)
+        return available
+
+    async def check_domain(self, domain: str) -> Optional[bool]:
+        """
+        Check one domain, sharing in-flight lookups
+
+        Returns:
+            True if available, False if taken, None if unknown
+        """
+        domain = domain.lower()
+        hit, available = self._cached(domain)
+        if hit:
+            return available
+
+        pending = self._pending.get(domain)
+        if pending is None:
+            pending = asyncio.ensure_future(self._lookup(domain))
+            self._pending[domain] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(domain, None))
+        return await asyncio.shield(pending)
+
+    async def check_name(self, name: str) -> List[Dict[str, Any]]:
+        """
+        Check every candidate domain for a name
+
+        Returns:
+            List of {"domain", "available"} dicts
+        """
+        domains = candidate_domains(name)
+        results = await asyncio.gather(*[self.check_domain(d) for d in domains])
+        return [{"domain": d, "available": a} for d, a in zip(domains, results)]
+
+    async def check_names(self, names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Check up to MAX_NAMES distinct names concurrently; the rest are left out"""
+        names = list(dict.fromkeys(names))[:MAX_NAMES]
+        results = await asyncio.gather(*[self.check_name(n) for n in names])
+        return dict(zip(names, results))
+
+    async def stream_names(self, names: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield domain annotations for each name as soon as its checks finish
+
+        Only the first MAX_NAMES distinct names are checked.
+
+        Yields:
+            {"name", "domains"} dicts in completion order
+        """
+        async def annotate(name: str) -> Dict[str, Any]:
+            return {"name": name, "domains": await self.check_name(name)}
+
+        for task in asyncio.as_completed([annotate(n) for n in list(dict.fromkeys(names))[:MAX_NAMES]]):
+            yield await task
+
+    async def annotate_generate_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a "domains" list to every name in a generate result (None past MAX_NAMES)"""
+        names = result.get("names", [])
+        checked = await self.check_names([n["name"] for n in names if n.get("name")])
+        return {
+            **result,
+            "names": [{**n, "domains": checked.get(n.get("name"))} for n in names]
+        }
+
+    async def annotate_deeper_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a "domains" list to every name in a Go Deeper result (None past MAX_NAMES)"""
+        threads = result.get("threads", [])
+        checked = await self.check_names([
+            n["name"] for t in threads for n in t.get("names", []) if n.get("name")
+        ])
+        return {
+            **result,
+            "threads": [
+                {**t, "names": [{**n, "domains": checked.get(n.get("name"))} for n in t.get("names", [])]}
+                for t in threads
+            ]
+        }
+
+    async def close(self):
+        await self.resolver.close()
+
+
+def _create_resolver() -> Any:
+    """Pick the resolver from FISSION_DOMAIN_RESOLVER (doh or stub)"""
+    if os.getenv("FISSION_DOMAIN_RESOLVER", "doh").lower() == "stub":
+        logger.info("Using stub domain resolver")
+        return StubResolver()
+    return DohResolver(os.getenv("FISSION_DOH_URL", DOH_URL))
+
+
+# Singleton instance
+domain_checker = DomainChecker(_create_resolver())
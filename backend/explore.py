@@ -0,0 +1,161 @@
+"""
+WebSocket exploration sessions for Fission API
+Holds context, history and seen names on the server across Go Deeper hops
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+
+from ranking import process_deeper_result
+
+logger = logging.getLogger(__name__)
+
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class ExplorationSession:
+    """
+    Server-side state for one exploration channel
+
+    Client messages:
+        {"type": "context", "context": "..."}
+        {"type": "explore", "name": "...", "dimensions": [...]}
+        {"type": "cancel"}
+
+    Server messages:
+        {"type": "session", "session_id", "context", "history"}
+        {"type": "thread", "exploration_id", "name", "thread"}
+        {"type": "done", "exploration_id", "name"}
+        {"type": "cancelled", "exploration_id", "name"}
+        {"type": "error", "detail"}
+    """
+
+    def __init__(self, generator: Any, store: Any, session_id: Optional[str] = None):
+        self.generator = generator
+        self.store = store
+
+        saved = store.get(session_id) if session_id else None
+        self.session_id = session_id if saved is not None else None
+        # Keep the whole saved session so generate calls and favorites
+        # stored through /api/sessions survive being resumed here
+        self._session: Dict[str, Any] = saved or {"generate": [], "favorites": []}
+        self.context: str = self._session.get("context", "")
+        self.history: List[Dict[str, Any]] = self._session.get("deeper", [])
+        self.seen = set(self._session.get("seen", []))
+
+        self._exploration_id = 0
+        self._task: Optional[asyncio.Task] = None
+
+        if self.session_id is None:
+            self._save()
+
+    def describe(self) -> Dict[str, Any]:
+        """Session message sent when the channel opens"""
+        return {
+            "type": "session",
+            "session_id": self.session_id,
+            "context": self.context,
+            "history": [h["name"] for h in self.history]
+        }
+
+    def _save(self):
+        self._session.update({
+            "context": self.context,
+            "deeper": self.history,
+            "seen": sorted(self.seen)
+        })
+        self.session_id = self.store.save(self._session, self.session_id)
+
+    def _deprioritize_seen(self, thread: Dict[str, Any]) -> Dict[str, Any]:
+        """Move names the user has already been shown to the end of a thread"""
+        names = sorted(
+            thread.get("names", []),
+            key=lambda n: n.get("name", "").lower().strip() in self.seen
+        )
+        return {**thread, "names": names}
+
+    async def _explore(self, exploration_id: int, name: str, dimensions: Optional[List[str]], send: Send):
+        # The context may change mid-flight; the result belongs to the one it was explored in
+        context = self.context
+        threads = []
+        emitted = 0
+        try:
+            async for thread in self.generator.go_deeper_stream(name, context, dimensions):
+                threads.append(thread)
+                # Earlier threads are stable under dedupe, so any new
+                # processed thread is always the last one
+                processed = process_deeper_result({"threads": threads}, name)["threads"]
+                if len(processed) == emitted:
+                    continue
+                emitted = len(processed)
+
+                thread_out = self._deprioritize_seen(processed[-1])
+                self.seen.update(n["name"].lower().strip() for n in thread_out["names"])
+                await send({
+                    "type": "thread",
+                    "exploration_id": exploration_id,
+                    "name": name,
+                    "thread": thread_out
+                })
+
+            self.seen.add(name.lower().strip())
+            # Snapshot the result so the session exports in full after the cache expires
+            self.history.append({
+                "name": name,
+                "context": context,
+                "result": {"source_name": name, "threads": threads}
+            })
+            self._save()
+            await send({"type": "done", "exploration_id": exploration_id, "name": name})
+
+        except asyncio.CancelledError:
+            logger.info(f"Exploration of '{name}' cancelled")
+            try:
+                await send({"type": "cancelled", "exploration_id": exploration_id, "name": name})
+            except Exception:
+                pass
+            raise
+        except Exception as e:
+            logger.error(f"Exploration of '{name}' failed: {e}")
+            try:
+                await send({"type": "error", "detail": str(e)})
+            except Exception:
+                pass
+
+    def cancel(self):
+        """Cancel the in-flight exploration, if any"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def handle(self, message: Dict[str, Any], send: Send):
+        """
+        Handle one client message
+
+        A new "explore" supersedes (and cancels) the previous one.
+        """
+        kind = message.get("type")
+
+        if kind == "context":
+            self.context = message.get("context", "")
+        elif kind == "explore":
+            name = (message.get("name") or "").strip()
+            if not name:
+                await send({"type": "error", "detail": "explore requires a name"})
+                return
+            dimensions = message.get("dimensions")
+            if dimensions is not None and not (
+                isinstance(dimensions, list) and all(isinstance(d, str) for d in dimensions)
+            ):
+                await send({"type": "error", "detail": "dimensions must be a list of strings"})
+                return
+            self.cancel()
+            self._exploration_id += 1
+            self._task = asyncio.create_task(
+                self._explore(self._exploration_id, name, dimensions, send)
+            )
+        elif kind == "cancel":
+            self.cancel()
+        else:
+            await send({"type": "error", "detail": f"Unknown message type: {kind}"})
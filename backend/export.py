@@ -0,0 +1,201 @@
+"""
+Streaming export for Fission API
+Writes names from cached results row by row as CSV, JSON Lines or SpreadsheetML
+"""
+
+import csv
+import io
+import json
+import logging
+from typing import Dict, Any, List, Iterator, Optional
+from xml.sax.saxutils import escape
+
+from cache import response_cache
+from generator import generate_cache_key, deeper_cache_key
+from graph import name_graph
+from ranking import process_generate_result, process_deeper_result
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ["source", "query", "thread", "name", "category", "origin", "meaning", "pronunciation", "tags"]
+
+FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    # SpreadsheetML 2003: plain XML that Excel opens directly and that can
+    # be written incrementally, unlike the zipped .xlsx container
+    "xls": ("application/vnd.ms-excel", "xls"),
+}
+
+
+def _row(source: str, query: str, thread: Optional[str], n: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "source": source,
+        "query": query,
+        "thread": thread,
+        "name": n.get("name"),
+        "category": n.get("category"),
+        "origin": n.get("origin"),
+        "meaning": n.get("meaning"),
+        "pronunciation": n.get("pronunciation"),
+        "tags": n.get("tags") or [],
+    }
+
+
+def _flat(value: Any) -> Any:
+    """Join list values (tags) for the tabular formats"""
+    return ";".join(value) if isinstance(value, list) else value
+
+
+def _cached_generate(req: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return response_cache.get(
+        generate_cache_key(req["prompt"], req.get("num_results", 50), req.get("style", "professional"))
+    )
+
+
+def _cached_deeper(req: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return (
+        response_cache.get(deeper_cache_key(req["name"], req.get("context", "")))
+        or name_graph.as_deeper_result(req["name"], req.get("context", ""), req.get("dimensions"))
+    )
+
+
+def snapshot_session(session: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Attach the current raw result to every generate/deeper entry of a session
+
+    The response cache expires after a few hours, so a session saved
+    without its results could later export only partially. Entries whose
+    results are already gone are kept without a snapshot.
+
+    Args:
+        session: Dict with "generate", "deeper" and "favorites" lists
+
+    Returns:
+        New session dict with a "result" on each entry that has one
+    """
+    def attach(req: Dict[str, Any], loader) -> Dict[str, Any]:
+        if req.get("result"):
+            return req
+        result = loader(req)
+        return {**req, "result": result} if result else req
+
+    return {
+        **session,
+        "generate": [attach(req, _cached_generate) for req in session.get("generate", [])],
+        "deeper": [attach(req, _cached_deeper) for req in session.get("deeper", [])]
+    }
+
+
+def iter_rows(
+    generate: Optional[List[Dict[str, Any]]] = None,
+    deeper: Optional[List[Dict[str, Any]]] = None,
+    favorites: Optional[List[Dict[str, Any]]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one row per exported name, loading one result at a time
+
+    Each entry uses its session snapshot ("result") when present, otherwise
+    the response cache. Results that are in neither are skipped; export
+    never calls Claude.
+
+    Args:
+        generate: Generate request dicts (prompt, num_results, style, categories)
+        deeper: Go Deeper request dicts (name, context, dimensions)
+        favorites: Name dicts saved by the user
+
+    Yields:
+        Row dicts keyed by COLUMNS
+    """
+    for n in favorites or []:
+        yield _row("favorite", "", None, n)
+
+    for req in generate or []:
+        prompt = req["prompt"]
+        num_results = req.get("num_results", 50)
+        cached = req.get("result") or _cached_generate(req)
+        if not cached:
+            logger.info(f"Export skipping uncached generate result for: {prompt}")
+            continue
+        result = process_generate_result(cached, req.get("categories"), limit=num_results)
+
+        thread_titles = {}
+        for thread in result.get("threads") or []:
+            for name_id in thread.get("name_ids") or []:
+                thread_titles.setdefault(name_id, thread.get("title"))
+
+        for n in result.get("names", []):
+            yield _row("generate", prompt, thread_titles.get(n.get("id")), n)
+
+    for req in deeper or []:
+        name = req["name"]
+        cached = req.get("result") or _cached_deeper(req)
+        if not cached:
+            logger.info(f"Export skipping uncached Go Deeper result for: {name}")
+            continue
+        result = process_deeper_result(cached, name)
+
+        for thread in result.get("threads", []):
+            for n in thread.get("names", []):
+                yield _row("deeper", name, thread.get("title"), n)
+
+
+def csv_lines(rows: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """Encode rows as CSV, one line at a time"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=COLUMNS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({c: _flat(v) for c, v in row.items()})
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def jsonl_lines(rows: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """Encode rows as JSON Lines, keeping tags as a list"""
+    for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+def spreadsheetml_lines(rows: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """Encode rows as a SpreadsheetML 2003 workbook with a single sheet"""
+    def cells(values: List[Any]) -> str:
+        return "".join(
+            f'<Cell><Data ss:Type="String">{escape(str(v if v is not None else ""))}</Data></Cell>'
+            for v in values
+        )
+
+    yield (
+        '<?xml version="1.0"?>\n'
+        '<?mso-application progid="Excel.Sheet"?>\n'
+        '<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet" '
+        'xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">\n'
+        '<Worksheet ss:Name="Names"><Table>\n'
+    )
+    yield f"<Row>{cells(COLUMNS)}</Row>\n"
+    for row in rows:
+        yield f"<Row>{cells([_flat(row[c]) for c in COLUMNS])}</Row>\n"
+    yield "</Table></Worksheet></Workbook>\n"
+
+
+ENCODERS = {
+    "csv": csv_lines,
+    "jsonl": jsonl_lines,
+    "xls": spreadsheetml_lines,
+}
+
+
+def export_lines(export_format: str, **sources: Any) -> Iterator[str]:
+    """
+    Stream an export document
+
+    Args:
+        export_format: One of FORMATS
+        **sources: generate, deeper and favorites lists for iter_rows
+
+    Returns:
+        Iterator of text chunks
+    """
+    return ENCODERS[export_format](iter_rows(**sources))
@@ -4,17 +4,110 @@ Claude-based name generation engine
 
 import os
 import json
+import math
 import logging
-from typing import Dict, Any, List, Optional
-from anthropic import Anthropic
+from typing import Dict, Any, List, Optional, AsyncIterator
+from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 
 from prompts import SYSTEM_PROMPT, GENERATE_PROMPT, GO_DEEPER_PROMPT
 from cache import response_cache
+from graph import name_graph
+from ranking import process_generate_result, process_deeper_result
+from timing import span
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Generate asks for a few more names than requested so near-duplicates
+# can be dropped without coming up short
+GENERATE_HEADROOM = 1.25
+GENERATE_SUPERSET_MAX = 120
+TOKENS_PER_NAME = 160
+
+
+def superset_size(num_results: int) -> int:
+    """Number of names requested upstream for a generate call"""
+    return max(num_results, min(math.ceil(num_results * GENERATE_HEADROOM), GENERATE_SUPERSET_MAX))
+
+
+class _ThreadScanner:
+    """Pulls complete thread objects out of a partially streamed Go Deeper response"""
+
+    def __init__(self):
+        self.text = ""
+        self._pos = None  # Scan position once inside the "threads" array
+        self._depth = 0
+        self._start = None
+        self._in_string = False
+        self._escape = False
+        self._done = False
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Append streamed text and return any threads completed by it"""
+        self.text += chunk
+        threads = []
+
+        if self._pos is None:
+            key = self.text.find('"threads"')
+            bracket = self.text.find('[', key) if key >= 0 else -1
+            if bracket < 0:
+                return threads
+            self._pos = bracket + 1
+
+        while not self._done and self._pos < len(self.text):
+            ch = self.text[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == '{':
+                if self._depth == 0:
+                    self._start = self._pos
+                self._depth += 1
+            elif ch == '}':
+                self._depth -= 1
+                if self._depth == 0 and self._start is not None:
+                    try:
+                        threads.append(json.loads(self.text[self._start:self._pos + 1]))
+                    except json.JSONDecodeError:
+                        pass
+                    self._start = None
+            elif ch == ']' and self._depth == 0:
+                self._done = True
+            self._pos += 1
+
+        return threads
+
+
+def generate_cache_key(prompt: str, num_results: int = 50, style: str = "professional") -> Dict[str, Any]:
+    """
+    Cache key data for a generate call
+
+    Keyed on the superset size derived from num_results; categories are
+    left out, so changing the filter reuses the same entry.
+    """
+    return {
+        "type": "generate",
+        "prompt": prompt.lower().strip(),
+        "superset": superset_size(num_results),
+        "style": style
+    }
+
+
+def deeper_cache_key(name: str, context: str = "") -> Dict[str, Any]:
+    """Cache key data for a Go Deeper call"""
+    return {
+        "type": "deeper",
+        "name": name.lower().strip(),
+        "context": context.lower().strip() if context else ""
+    }
+
 
 class NameGenerator:
     """Claude-powered business name generator"""
@@ -22,13 +115,14 @@ class NameGenerator:
     def __init__(self):
         self.client = None
         self.model = "claude-sonnet-4-20250514"  # Fast and capable
+        self.tokens_used = 0  # Cumulative input + output tokens spent upstream
         self._initialize_client()
 
     def _initialize_client(self):
         """Initialize the Anthropic client"""
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if api_key:
-            self.client = Anthropic(api_key=api_key)
+            self.client = AsyncAnthropic(api_key=api_key)
             logger.info("Anthropic client initialized successfully")
         else:
             logger.warning("ANTHROPIC_API_KEY not found - Claude features disabled")
@@ -50,41 +144,51 @@ class NameGenerator:
         Args:
             prompt: The user's description or seed name
             num_results: Number of names to generate
-            categories: Optional list of categories to focus on
+            categories: Optional list of categories to keep (filtered
+                locally, so fewer than num_results names may be returned)
             style: professional, playful, bold, minimal
 
         Returns:
-            Dict with names and threads
+            Dict with names and threads, deduplicated and diversified
+        """
+        result = await self._generate_superset(prompt, superset_size(num_results), style)
+        with span("rank"):
+            return process_generate_result(result, categories, limit=num_results)
+
+    async def _generate_superset(self, prompt: str, size: int, style: str) -> Dict[str, Any]:
+        """
+        Generate (or load from cache) the unfiltered superset of names for a prompt
+
+        Categories are deliberately left out of the cache key and the
+        prompt, so changing the filter is served from the same entry.
         """
         # Check cache first
-        cache_key = {
-            "type": "generate",
-            "prompt": prompt.lower().strip(),
-            "num_results": num_results,
-            "style": style
-        }
+        cache_key = generate_cache_key(prompt, size, style)
         cached = response_cache.get(cache_key)
         if cached:
             logger.info(f"Returning cached result for: {prompt}")
             return cached
 
         if not self.client:
-            return self._generate_fallback(prompt, num_results)
+            return self._generate_fallback(prompt, size)
 
         try:
             user_prompt = GENERATE_PROMPT.format(
                 prompt=prompt,
-                num_results=num_results
+                num_results=size
             )
 
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                system=SYSTEM_PROMPT,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ]
-            )
+            with span("upstream"):
+                response = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=TOKENS_PER_NAME * size + 1024,
+                    system=SYSTEM_PROMPT,
+                    messages=[
+                        {"role": "user", "content": user_prompt}
+                    ]
+                )
+
+            self._record_usage(response)
 
             # Parse the response
             content = response.content[0].text
@@ -96,11 +200,11 @@ class NameGenerator:
                 return result
             else:
                 logger.error("Failed to parse Claude response")
-                return self._generate_fallback(prompt, num_results)
+                return self._generate_fallback(prompt, size)
 
         except Exception as e:
             logger.error(f"Claude generation error: {e}")
-            return self._generate_fallback(prompt, num_results)
+            return self._generate_fallback(prompt, size)
 
     async def go_deeper(
         self,
@@ -117,43 +221,51 @@ class NameGenerator:
             dimensions: Which dimensions to explore
 
         Returns:
-            Dict with threads of related names
+            Dict with threads of related names, deduplicated across threads
         """
-        # Check cache first
-        cache_key = {
-            "type": "deeper",
-            "name": name.lower().strip(),
-            "context": context.lower().strip() if context else ""
-        }
-        cached = response_cache.get(cache_key)
-        if cached:
-            logger.info(f"Returning cached Go Deeper result for: {name}")
-            return cached
+        result = await self._go_deeper_raw(name, context, dimensions)
+        with span("rank"):
+            return process_deeper_result(result, name)
+
+    async def _go_deeper_raw(
+        self,
+        name: str,
+        context: str,
+        dimensions: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Go Deeper from cache, graph or Claude, without post-processing"""
+        ready = self._go_deeper_ready(name, context, dimensions)
+        if ready:
+            return ready
 
         if not self.client:
             return self._deeper_fallback(name)
 
+        cache_key = deeper_cache_key(name, context)
         try:
             user_prompt = GO_DEEPER_PROMPT.format(
                 name=name,
                 context=context or "general business"
             )
 
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                system=SYSTEM_PROMPT,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ]
-            )
+            with span("upstream"):
+                response = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=4096,
+                    system=SYSTEM_PROMPT,
+                    messages=[
+                        {"role": "user", "content": user_prompt}
+                    ]
+                )
 
+            self._record_usage(response)
             content = response.content[0].text
             result = self._parse_json_response(content)
 
             if result:
-                # Cache the result
+                # Cache the result and remember its relationships
                 response_cache.set(cache_key, result, ttl=7200)  # 2 hours
+                name_graph.add_deeper_result(name, result, context)
                 return result
             else:
                 logger.error("Failed to parse Claude Go Deeper response")
@@ -163,8 +275,105 @@ class NameGenerator:
             logger.error(f"Claude Go Deeper error: {e}")
             return self._deeper_fallback(name)
 
+    def _go_deeper_ready(
+        self,
+        name: str,
+        context: str,
+        dimensions: Optional[List[str]]
+    ) -> Optional[Dict[str, Any]]:
+        """Go Deeper result from the cache or the exploration graph, if any"""
+        # Check cache first
+        cached = response_cache.get(deeper_cache_key(name, context))
+        if cached:
+            logger.info(f"Returning cached Go Deeper result for: {name}")
+            return cached
+
+        # Serve from the exploration graph once it knows enough about this
+        # name in this context
+        with span("graph"):
+            from_graph = name_graph.as_deeper_result(name, context, dimensions)
+        if from_graph:
+            logger.info(f"Returning Go Deeper result from graph for: {name}")
+            return from_graph
+
+        return None
+
+    async def go_deeper_stream(
+        self,
+        name: str,
+        context: str = "",
+        dimensions: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Explore a name, yielding each raw thread as soon as it is complete
+
+        Streams the Claude response and parses threads out of the partial
+        JSON, so the first dimension arrives long before the last. Closing
+        the iterator (e.g. cancelling the consuming task) aborts the
+        upstream request.
+
+        Args:
+            name: The name to explore
+            context: Business context
+            dimensions: Which dimensions to explore
+
+        Yields:
+            Thread dicts, not yet deduplicated
+        """
+        ready = self._go_deeper_ready(name, context, dimensions)
+        if ready or not self.client:
+            for thread in (ready or self._deeper_fallback(name)).get("threads", []):
+                yield thread
+            return
+
+        scanner = _ThreadScanner()
+        yielded = False
+        try:
+            user_prompt = GO_DEEPER_PROMPT.format(
+                name=name,
+                context=context or "general business"
+            )
+
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=4096,
+                system=SYSTEM_PROMPT,
+                messages=[
+                    {"role": "user", "content": user_prompt}
+                ]
+            ) as stream:
+                async for text in stream.text_stream:
+                    for thread in scanner.feed(text):
+                        yielded = True
+                        yield thread
+                self._record_usage(await stream.get_final_message())
+
+            result = self._parse_json_response(scanner.text)
+            if result:
+                # Cache the result and remember its relationships
+                response_cache.set(deeper_cache_key(name, context), result, ttl=7200)  # 2 hours
+                name_graph.add_deeper_result(name, result, context)
+            else:
+                logger.error("Failed to parse streamed Claude Go Deeper response")
+
+        except Exception as e:
+            logger.error(f"Claude Go Deeper stream error: {e}")
+            if not yielded:
+                for thread in self._deeper_fallback(name)["threads"]:
+                    yield thread
+
+    def _record_usage(self, response: Any):
+        """Add a response's token usage to the running total"""
+        usage = getattr(response, "usage", None)
+        if usage:
+            self.tokens_used += (usage.input_tokens or 0) + (usage.output_tokens or 0)
+
     def _parse_json_response(self, content: str) -> Optional[Dict[str, Any]]:
         """Parse JSON from Claude's response"""
+        with span("parse"):
+            return self._parse_json(content)
+
+    def _parse_json(self, content: str) -> Optional[Dict[str, Any]]:
         try:
             # Try direct parse first
             return json.loads(content)
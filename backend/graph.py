@@ -0,0 +1,293 @@
+"""
+Exploration graph for Fission API
+Persistent name graph with dimension-typed edges filled from Go Deeper results
+"""
+
+import json
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from cache import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+GRAPH_PATH = CACHE_DIR / "graph" / "results.jsonl"
+
+# Dimensions where "A relates to B" also means "B relates to A"
+SYMMETRIC_DIMENSIONS = {"same_family", "similar_meaning", "phonetic", "cross_cultural"}
+
+MIN_DIMENSIONS = 4  # Dimensions needed before a name is served from the graph
+MIN_NAMES_PER_DIMENSION = 3
+MAX_NAMES_PER_DIMENSION = 8
+MAX_HOPS = 3
+MAX_NODES = 500
+MAX_RESULTS = 2000  # Go Deeper results kept; older ones are evicted
+
+
+def _key(name: str) -> str:
+    return name.lower().strip() if name else ""
+
+
+def _valid_entry(entry: Any) -> bool:
+    """Check a log line has the shape add_deeper_result writes"""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get('context'), str)
+        and isinstance(entry.get('name'), str)
+        and isinstance(entry.get('result'), dict)
+    )
+
+
+class NameGraph:
+    """
+    Name graph with edges typed by Go Deeper dimension
+
+    Edges are scoped by business context (normalized the same way as the
+    Go Deeper cache key), so relationships found for one context are
+    never served for another. The graph is rebuilt from an append-only
+    log of Go Deeper results: each hop appends one line, and once the
+    log holds twice MAX_RESULTS entries it is compacted to the newest
+    MAX_RESULTS.
+    """
+
+    def __init__(self, path: Path = GRAPH_PATH, max_results: int = MAX_RESULTS):
+        self.path = path
+        self.max_results = max_results
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        # context -> source key -> dimension -> {"title", "description", "targets": [keys]}
+        self.edges: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        self._results: List[Dict[str, Any]] = []
+        self._load()
+
+    def _load(self):
+        """Replay the result log from disk if present"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if _valid_entry(entry):
+                        self._results.append(entry)
+        except IOError as e:
+            logger.error(f"Graph read error: {e}")
+            return
+
+        self._results = self._results[-self.max_results:]
+        self._rebuild()
+        logger.info(f"Loaded name graph with {len(self.nodes)} nodes")
+
+    def _rebuild(self):
+        self.nodes = {}
+        self.edges = {}
+        for entry in self._results:
+            self._apply(entry['context'], entry['name'], entry['result'])
+
+    def _append(self, entry: Dict[str, Any]):
+        """Append one result to the log"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+        except IOError as e:
+            logger.error(f"Graph write error: {e}")
+
+    def _compact(self):
+        """Evict the oldest results and rewrite the log atomically"""
+        self._results = self._results[-self.max_results:]
+        self._rebuild()
+        try:
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                for entry in self._results:
+                    f.write(json.dumps(entry) + "\n")
+            tmp_path.replace(self.path)
+            logger.info(f"Compacted name graph to {len(self._results)} results")
+        except IOError as e:
+            logger.error(f"Graph write error: {e}")
+
+    def _add_node(self, name: str, meaning: Optional[str] = None, origin: Optional[str] = None) -> str:
+        key = _key(name)
+        node = self.nodes.setdefault(key, {'name': name.strip(), 'meaning': None, 'origin': None})
+        node['meaning'] = node['meaning'] or meaning
+        node['origin'] = node['origin'] or origin
+        return key
+
+    def _add_edge(
+        self,
+        context: str,
+        source: str,
+        target: str,
+        dimension: str,
+        title: str,
+        description: Optional[str]
+    ):
+        if source == target:
+            return
+        edge = self.edges.setdefault(context, {}).setdefault(source, {}).setdefault(dimension, {
+            'title': title,
+            'description': description,
+            'targets': []
+        })
+        if target not in edge['targets']:
+            edge['targets'].append(target)
+
+    def _apply(self, context: str, name: str, result: Dict[str, Any]):
+        source = self._add_node(result.get('source_name') or name)
+
+        for thread in result.get('threads', []):
+            dimension = thread.get('dimension')
+            if not dimension:
+                continue
+            title = thread.get('title', dimension.replace('_', ' ').title())
+            description = thread.get('description')
+
+            for n in thread.get('names', []):
+                if not n.get('name'):
+                    continue
+                target = self._add_node(n['name'], n.get('meaning'), n.get('origin'))
+                self._add_edge(context, source, target, dimension, title, description)
+                if dimension in SYMMETRIC_DIMENSIONS:
+                    self._add_edge(context, target, source, dimension, title, description)
+
+    def add_deeper_result(self, name: str, result: Dict[str, Any], context: str = ""):
+        """
+        Record every relationship in a Go Deeper result
+
+        Args:
+            name: The explored name
+            result: Go Deeper result dict with threads of names
+            context: Business context the result was generated for
+        """
+        entry = {'context': _key(context), 'name': name, 'result': result}
+        self._results.append(entry)
+        self._apply(entry['context'], name, result)
+        self._append(entry)
+
+        if len(self._results) >= 2 * self.max_results:
+            self._compact()
+
+    def as_deeper_result(
+        self,
+        name: str,
+        context: str = "",
+        dimensions: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a Go Deeper result purely from stored edges
+
+        Args:
+            name: The name to explore
+            context: Business context; only edges found for it are used
+            dimensions: Optional dimensions to restrict the result to
+
+        Returns:
+            Go Deeper result dict, or None if the graph doesn't know enough yet
+        """
+        source = _key(name)
+        edges = self.edges.get(_key(context), {}).get(source, {})
+        if dimensions:
+            edges = {d: e for d, e in edges.items() if d in dimensions}
+
+        filled = {
+            d: e for d, e in edges.items()
+            if len(e['targets']) >= MIN_NAMES_PER_DIMENSION
+        }
+        required = min(MIN_DIMENSIONS, len(dimensions)) if dimensions else MIN_DIMENSIONS
+        if len(filled) < required:
+            return None
+
+        threads = []
+        for dimension, edge in filled.items():
+            names = []
+            for i, target in enumerate(edge['targets'][:MAX_NAMES_PER_DIMENSION]):
+                node = self.nodes[target]
+                names.append({
+                    'id': f"graph_{dimension}_{i}",
+                    'name': node['name'],
+                    'meaning': node.get('meaning'),
+                    'origin': node.get('origin')
+                })
+            threads.append({
+                'dimension': dimension,
+                'title': edge['title'],
+                'description': edge.get('description'),
+                'names': names
+            })
+
+        return {
+            'source_name': self.nodes.get(source, {}).get('name', name),
+            'threads': threads
+        }
+
+    def neighborhood(
+        self,
+        name: str,
+        context: str = "",
+        hops: int = 1,
+        dimensions: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the k-hop neighborhood around a name
+
+        Args:
+            name: The center name
+            context: Business context whose edges to follow
+            hops: Number of hops to expand (capped at MAX_HOPS)
+            dimensions: Optional dimensions to follow
+
+        Returns:
+            Dict with nodes and typed edges
+        """
+        hops = max(0, min(hops, MAX_HOPS))
+        context_edges = self.edges.get(_key(context), {})
+        start = _key(name)
+        if start not in self.nodes:
+            return {'source_name': name, 'nodes': [], 'edges': []}
+
+        depths = {start: 0}
+        edges = []
+        queue = deque([start])
+
+        while queue:
+            current = queue.popleft()
+            if depths[current] >= hops:
+                continue
+            for dimension, edge in context_edges.get(current, {}).items():
+                if dimensions and dimension not in dimensions:
+                    continue
+                for target in edge['targets']:
+                    if target not in depths:
+                        if len(depths) >= MAX_NODES:
+                            continue
+                        depths[target] = depths[current] + 1
+                        queue.append(target)
+                    edges.append({'source': current, 'target': target, 'dimension': dimension})
+
+        nodes = [
+            {'id': key, 'depth': depth, **self.nodes[key]}
+            for key, depth in depths.items()
+        ]
+        return {'source_name': self.nodes[start]['name'], 'nodes': nodes, 'edges': edges}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get graph statistics"""
+        return {
+            'total_results': len(self._results),
+            'total_nodes': len(self.nodes),
+            'total_edges': sum(
+                len(e['targets'])
+                for sources in self.edges.values()
+                for dims in sources.values()
+                for e in dims.values()
+            )
+        }
+
+
+# Singleton instance
+name_graph = NameGraph()
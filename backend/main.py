@@ -3,28 +3,62 @@ Fission - Business Name Ideation Engine
 FastAPI Backend with Claude-based generation
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from contextlib import asynccontextmanager
+import asyncio
+import json
 import logging
+import os
+from typing import List, Optional
+from pydantic import BaseModel
 
 from models import (
     GenerateRequest, GenerateResponse, NameResult,
-    DeeperRequest, DeeperResponse,
+    DeeperRequest, DeeperResponse, GraphResponse, DomainsRequest,
+    SessionRequest, SessionResponse, ExportRequest,
     CategoriesResponse, Category,
     ExamplesResponse, HealthResponse
 )
 from generator import name_generator
+from domains import domain_checker
+from explore import ExplorationSession
+from export import FORMATS, export_lines, snapshot_session
+from sessions import session_store
+from graph import name_graph, MAX_HOPS
 from prompts import CATEGORIES_LIST, EXAMPLE_PROMPTS
+from timing import TimingMiddleware, span
+from warmup import CacheWarmer, access_history
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+cache_warmer = CacheWarmer(name_generator, access_history)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the cache in the background so /api/health can report progress"""
+    task = None
+    if os.getenv("FISSION_WARMUP", "true").lower() in ("1", "true", "yes"):
+        task = asyncio.create_task(cache_warmer.warm())
+    else:
+        cache_warmer.state = "skipped"
+    yield
+    if task and not task.done():
+        task.cancel()
+    await domain_checker.close()
+    access_history.flush()
+
+
 # Initialize FastAPI
 app = FastAPI(
     title="Fission API",
     description="Business Name Ideation Engine powered by Claude",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -34,8 +68,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+# Server-Timing header, structured timing logs and opt-in profiling
+app.add_middleware(TimingMiddleware)
+
+
+def json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model inside a span
+
+    FastAPI would otherwise re-validate and serialize the return value
+    against response_model after the handler, outside every span.
+    """
+    with span("serialize"):
+        return Response(model.model_dump_json(), media_type="application/json")
+
 
 @app.get("/")
 async def root():
@@ -53,10 +102,26 @@ async def health_check():
     return HealthResponse(
         status="healthy",
         claude_available=name_generator.is_available(),
-        version="1.0.0"
+        version="1.0.0",
+        ready=cache_warmer.is_ready,
+        warmup=cache_warmer.get_status()
     )
 
 
+@app.get("/api/ready")
+async def readiness_check(response: Response):
+    """
+    Readiness check for the load balancer.
+
+    Returns 503 while the cache warm-up is running so traffic can be held
+    until the hot set is precomputed.
+    """
+    ready = cache_warmer.is_ready
+    if not ready:
+        response.status_code = 503
+    return {"ready": ready, "warmup": cache_warmer.get_status()}
+
+
 @app.post("/api/generate", response_model=GenerateResponse)
 async def generate_names(request: GenerateRequest):
     """
@@ -69,6 +134,7 @@ async def generate_names(request: GenerateRequest):
     """
     try:
         logger.info(f"Generate request: '{request.prompt}' (num_results={request.num_results})")
+        access_history.record(request.prompt)
 
         result = await name_generator.generate(
             prompt=request.prompt,
@@ -76,27 +142,33 @@ async def generate_names(request: GenerateRequest):
             categories=request.categories,
             style=request.style
         )
+        if request.check_domains:
+            with span("domains"):
+                result = await domain_checker.annotate_generate_result(result)
 
         # Convert to response model
-        names = [
-            NameResult(
-                id=n.get("id", f"name_{i}"),
-                name=n.get("name", "Unknown"),
-                category=n.get("category", "modern"),
-                origin=n.get("origin"),
-                meaning=n.get("meaning"),
-                pronunciation=n.get("pronunciation"),
-                tags=n.get("tags")
+        with span("models"):
+            names = [
+                NameResult(
+                    id=n.get("id", f"name_{i}"),
+                    name=n.get("name", "Unknown"),
+                    category=n.get("category", "modern"),
+                    origin=n.get("origin"),
+                    meaning=n.get("meaning"),
+                    pronunciation=n.get("pronunciation"),
+                    tags=n.get("tags"),
+                    domains=n.get("domains")
+                )
+                for i, n in enumerate(result.get("names", []))
+            ]
+
+            response = GenerateResponse(
+                query=request.prompt,
+                names=names,
+                threads=result.get("threads"),
+                total_results=len(names)
             )
-            for i, n in enumerate(result.get("names", []))
-        ]
-
-        return GenerateResponse(
-            query=request.prompt,
-            names=names,
-            threads=result.get("threads"),
-            total_results=len(names)
-        )
+        return json_response(response)
 
     except Exception as e:
         logger.error(f"Generate error: {e}")
@@ -123,17 +195,139 @@ async def go_deeper(request: DeeperRequest):
             context=request.context,
             dimensions=request.dimensions
         )
+        if request.check_domains:
+            with span("domains"):
+                result = await domain_checker.annotate_deeper_result(result)
 
-        return DeeperResponse(
-            source_name=result.get("source_name", request.name),
-            threads=result.get("threads", [])
-        )
+        with span("models"):
+            response = DeeperResponse(
+                source_name=result.get("source_name", request.name),
+                threads=result.get("threads", [])
+            )
+        return json_response(response)
 
     except Exception as e:
         logger.error(f"Go Deeper error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/domains")
+async def check_domains(request: DomainsRequest):
+    """
+    Check candidate domains (.com, .io, .ai, hyphen and prefix variants)
+    for a batch of names.
+
+    Streams one JSON line per name as soon as its checks complete, so the
+    frontend can annotate generate/deeper results without waiting for
+    the slowest lookup.
+    """
+    async def lines():
+        async for annotation in domain_checker.stream_names(request.names):
+            yield json.dumps(annotation) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.websocket("/api/ws/explore")
+async def explore_channel(websocket: WebSocket, session_id: Optional[str] = None):
+    """
+    Exploration session channel.
+
+    Keeps the context, history and already-seen names on the server so
+    each hop is just {"type": "explore", "name": ...}. Threads are pushed
+    as soon as they complete, a new explore cancels the one in flight,
+    and names already shown are moved to the end of each thread. Pass
+    ?session_id=... to resume a saved session.
+    """
+    await websocket.accept()
+    session = ExplorationSession(name_generator, session_store, session_id)
+    await websocket.send_json(session.describe())
+
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except ValueError:
+                await websocket.send_json({"type": "error", "detail": "Invalid JSON"})
+                continue
+            if not isinstance(message, dict):
+                await websocket.send_json({"type": "error", "detail": "Expected a JSON object"})
+                continue
+            await session.handle(message, websocket.send_json)
+    except WebSocketDisconnect:
+        logger.info(f"Exploration channel closed (session {session.session_id[:8]}...)")
+    finally:
+        session.cancel()
+
+
+@app.post("/api/sessions", response_model=SessionResponse)
+async def save_session(request: SessionRequest):
+    """
+    Save the generate/deeper calls and favorites of an exploration session.
+
+    The current results are snapshotted into the session so it can still
+    be exported in full after the response cache expires.
+    """
+    session = snapshot_session(request.model_dump())
+    return SessionResponse(session_id=session_store.save(session))
+
+
+@app.get("/api/sessions/{session_id}", response_model=SessionRequest)
+async def get_session(session_id: str):
+    """Load a saved exploration session"""
+    session = session_store.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return SessionRequest(**session)
+
+
+@app.post("/api/export")
+async def export_names(request: ExportRequest):
+    """
+    Export names from cached generate/deeper results, favorites and
+    saved sessions.
+
+    Formats: csv, jsonl, xls (SpreadsheetML, opens in Excel).
+    Rows are streamed as they are produced, so large exports start
+    downloading immediately and use constant memory. Results that are
+    no longer cached are skipped.
+    """
+    if request.format not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {request.format}")
+
+    sources = request.model_dump(include={"generate", "deeper", "favorites"})
+    if request.session_id:
+        session = session_store.get(request.session_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail="Session not found")
+        for key in sources:
+            sources[key] = session.get(key, []) + sources[key]
+
+    media_type, extension = FORMATS[request.format]
+    return StreamingResponse(
+        export_lines(request.format, **sources),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="fission-names.{extension}"'}
+    )
+
+
+@app.get("/api/graph", response_model=GraphResponse)
+async def get_graph(
+    name: str,
+    context: str = "",
+    hops: int = Query(1, ge=0, le=MAX_HOPS),
+    dimensions: Optional[List[str]] = Query(None)
+):
+    """
+    Get the k-hop neighborhood of a name from the exploration graph.
+
+    Edges are filled from every Go Deeper result, typed by dimension and
+    scoped by business context, so a whole exploration path can be
+    fetched in a single call.
+    """
+    return GraphResponse(**name_graph.neighborhood(name, context=context, hops=hops, dimensions=dimensions))
+
+
 @app.get("/api/categories", response_model=CategoriesResponse)
 async def get_categories():
     """Get available name categories"""
@@ -2,7 +2,7 @@
 Pydantic models for Fission API
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 
 
@@ -11,6 +11,12 @@ class GenerateRequest(BaseModel):
     num_results: int = 50
     categories: Optional[List[str]] = None
     style: str = "professional"
+    check_domains: bool = False
+
+
+class DomainStatus(BaseModel):
+    domain: str
+    available: Optional[bool] = None
 
 
 class NameResult(BaseModel):
@@ -21,6 +27,7 @@ class NameResult(BaseModel):
     meaning: Optional[str] = None
     pronunciation: Optional[str] = None
     tags: Optional[List[str]] = None
+    domains: Optional[List[DomainStatus]] = None
 
 
 class Thread(BaseModel):
@@ -42,6 +49,7 @@ class DeeperRequest(BaseModel):
     name: str
     context: str = ""
     dimensions: Optional[List[str]] = None
+    check_domains: bool = False
 
 
 class DeeperName(BaseModel):
@@ -49,6 +57,7 @@ class DeeperName(BaseModel):
     name: str
     meaning: Optional[str] = None
     origin: Optional[str] = None
+    domains: Optional[List[DomainStatus]] = None
 
 
 class DeeperThread(BaseModel):
@@ -63,6 +72,60 @@ class DeeperResponse(BaseModel):
     threads: List[DeeperThread]
 
 
+class DomainsRequest(BaseModel):
+    # Keep in step with domains.MAX_NAMES; each name fans out into 5-6 lookups
+    names: List[str] = Field(..., max_length=200)
+
+
+class FavoriteName(BaseModel):
+    """A favorited name from either generate or Go Deeper results"""
+    id: str
+    name: str
+    category: Optional[str] = None
+    origin: Optional[str] = None
+    meaning: Optional[str] = None
+    pronunciation: Optional[str] = None
+    tags: Optional[List[str]] = None
+
+
+class SessionRequest(BaseModel):
+    generate: List[GenerateRequest] = []
+    deeper: List[DeeperRequest] = []
+    favorites: List[FavoriteName] = []
+
+
+class SessionResponse(BaseModel):
+    session_id: str
+
+
+class ExportRequest(BaseModel):
+    format: str = "csv"
+    session_id: Optional[str] = None
+    generate: List[GenerateRequest] = []
+    deeper: List[DeeperRequest] = []
+    favorites: List[FavoriteName] = []
+
+
+class GraphNode(BaseModel):
+    id: str
+    name: str
+    depth: int
+    meaning: Optional[str] = None
+    origin: Optional[str] = None
+
+
+class GraphEdge(BaseModel):
+    source: str
+    target: str
+    dimension: str
+
+
+class GraphResponse(BaseModel):
+    source_name: str
+    nodes: List[GraphNode]
+    edges: List[GraphEdge]
+
+
 class Category(BaseModel):
     id: str
     name: str
@@ -82,3 +145,5 @@ class HealthResponse(BaseModel):
     status: str
     claude_available: bool
     version: str
+    ready: bool = True
+    warmup: Optional[Dict[str, Any]] = None
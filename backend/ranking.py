@@ -0,0 +1,193 @@
+"""
+Result post-processing for Fission API
+Near-duplicate removal, diversity reranking and category filtering
+"""
+
+import logging
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+DUPLICATE_THRESHOLD = 0.75  # Cosine similarity above which names are near-duplicates
+MMR_LAMBDA = 0.7  # 1.0 = keep original order, 0.0 = maximize diversity
+
+
+def _ngrams(name: str, n: int = NGRAM_SIZE) -> List[str]:
+    padded = f"^{name.lower().strip()}$"
+    if len(padded) <= n:
+        return [padded]
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+
+def ngram_vectors(names: List[str]) -> np.ndarray:
+    """
+    Build L2-normalized character n-gram count vectors
+
+    Args:
+        names: Names to vectorize
+
+    Returns:
+        Array of shape (len(names), vocabulary size)
+    """
+    grams = [_ngrams(name) for name in names]
+    vocab: Dict[str, int] = {}
+    for name_grams in grams:
+        for g in name_grams:
+            vocab.setdefault(g, len(vocab))
+
+    rows = np.repeat(np.arange(len(grams)), [len(g) for g in grams])
+    cols = np.fromiter((vocab[g] for name_grams in grams for g in name_grams), dtype=np.intp, count=len(rows))
+    vectors = np.zeros((len(grams), max(len(vocab), 1)), dtype=np.float32)
+    np.add.at(vectors, (rows, cols), 1.0)
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-9)
+
+
+def similarity_matrix(names: List[str]) -> np.ndarray:
+    """Pairwise cosine similarity between names"""
+    vectors = ngram_vectors(names)
+    return vectors @ vectors.T
+
+
+def dedupe_indices(sim: np.ndarray, threshold: float = DUPLICATE_THRESHOLD) -> List[int]:
+    """
+    Greedily keep the first of every group of near-duplicates
+
+    Args:
+        sim: Pairwise similarity matrix
+        threshold: Similarity at or above which a later item is dropped
+
+    Returns:
+        Indices of the items to keep, in original order
+    """
+    count = sim.shape[0]
+    dropped = np.zeros(count, dtype=bool)
+    for i in range(count):
+        if dropped[i]:
+            continue
+        dropped[i + 1:] |= sim[i, i + 1:] >= threshold
+    return np.flatnonzero(~dropped).tolist()
+
+
+def mmr_order(sim: np.ndarray, limit: Optional[int] = None, lambda_: float = MMR_LAMBDA) -> List[int]:
+    """
+    Maximal Marginal Relevance ordering
+
+    Relevance is taken from the original position (the model lists its
+    strongest suggestions first); each pick is penalized by its highest
+    similarity to the names already picked.
+
+    Args:
+        sim: Pairwise similarity matrix
+        limit: Number of items to return (default: all)
+        lambda_: Trade-off between relevance and diversity
+
+    Returns:
+        Indices in reranked order
+    """
+    count = sim.shape[0]
+    limit = count if limit is None else min(limit, count)
+    if limit <= 0:
+        return []
+
+    relevance = 1.0 - np.arange(count, dtype=np.float32) / max(count, 1)
+    max_sim = np.zeros(count, dtype=np.float32)
+    available = np.ones(count, dtype=bool)
+    order = []
+
+    for _ in range(limit):
+        scores = lambda_ * relevance - (1.0 - lambda_) * max_sim
+        scores[~available] = -np.inf
+        pick = int(np.argmax(scores))
+        order.append(pick)
+        available[pick] = False
+        np.maximum(max_sim, sim[pick], out=max_sim)
+
+    return order
+
+
+def process_generate_result(
+    result: Dict[str, Any],
+    categories: Optional[List[str]] = None,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Filter, dedupe and diversify a generate result
+
+    Works on a copy so the cached superset is left untouched; changing the
+    category filter never needs a new upstream call.
+
+    Args:
+        result: Generate result dict with names and threads
+        categories: Optional categories to keep
+        limit: Maximum number of names to return
+
+    Returns:
+        New result dict with threads pruned to the surviving names
+    """
+    names = [n for n in result.get("names", []) if n.get("name")]
+    if categories:
+        wanted = {c.lower() for c in categories}
+        names = [n for n in names if (n.get("category") or "modern").lower() in wanted]
+
+    if names:
+        sim = similarity_matrix([n["name"] for n in names])
+        keep = dedupe_indices(sim)
+        sim = sim[np.ix_(keep, keep)]
+        names = [names[keep[i]] for i in mmr_order(sim, limit)]
+
+    kept_ids = {n.get("id") for n in names}
+    threads = []
+    for thread in result.get("threads") or []:
+        name_ids = [i for i in thread.get("name_ids") or [] if i in kept_ids]
+        if name_ids:
+            threads.append({**thread, "name_ids": name_ids})
+
+    return {**result, "names": names, "threads": threads}
+
+
+def process_deeper_result(result: Dict[str, Any], source_name: str) -> Dict[str, Any]:
+    """
+    Remove near-duplicates across Go Deeper threads and diversify each thread
+
+    A name (or a near-duplicate of it) is kept only in the first thread it
+    appears in, and the source name itself is never repeated. Names merely
+    close to the source are kept, since syllable remixes are meant to be.
+
+    Args:
+        result: Go Deeper result dict with threads of names
+        source_name: The explored name
+
+    Returns:
+        New result dict; threads left empty are dropped
+    """
+    threads = result.get("threads", [])
+    source_key = source_name.lower().strip()
+    # Drop repeats of the source before deduping, so they can't knock out remixes
+    flat = [
+        (t, n) for t, thread in enumerate(threads) for n in thread.get("names", [])
+        if n.get("name") and n["name"].lower().strip() != source_key
+    ]
+    if not flat:
+        return {**result, "threads": []}
+
+    sim = similarity_matrix([n["name"] for _, n in flat])
+    keep = dedupe_indices(sim)
+
+    by_thread: Dict[int, List[int]] = {}
+    for i in keep:
+        by_thread.setdefault(flat[i][0], []).append(i)
+
+    processed = []
+    for t, thread in enumerate(threads):
+        indices = by_thread.get(t)
+        if not indices:
+            continue
+        order = mmr_order(sim[np.ix_(indices, indices)])
+        processed.append({**thread, "names": [flat[indices[j]][1] for j in order]})
+
+    return {**result, "threads": processed}
@@ -0,0 +1,71 @@
+"""
+Saved exploration sessions for Fission API
+File-based store of the generate/deeper calls and favorites in a session
+"""
+
+import json
+import uuid
+import time
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from cache import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+SESSIONS_DIR = CACHE_DIR / "sessions"
+
+
+class SessionStore:
+    """File-based store for exploration sessions"""
+
+    def __init__(self, sessions_dir: Path = SESSIONS_DIR):
+        self.sessions_dir = sessions_dir
+
+    def _get_session_path(self, session_id: str) -> Path:
+        # Session ids are generated hex strings; reject anything else
+        if not session_id.isalnum():
+            raise ValueError(f"Invalid session id: {session_id}")
+        return self.sessions_dir / f"{session_id}.json"
+
+    def save(self, session: Dict[str, Any], session_id: Optional[str] = None) -> str:
+        """
+        Save a session
+
+        Args:
+            session: Dict with "generate", "deeper" and "favorites" lists
+            session_id: Existing id to overwrite, or None for a new session
+
+        Returns:
+            The session id
+        """
+        session_id = session_id or uuid.uuid4().hex
+        path = self._get_session_path(session_id)
+        try:
+            self.sessions_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump({**session, 'updated_at': time.time()}, f)
+            logger.info(f"Saved session {session_id[:8]}...")
+        except IOError as e:
+            logger.error(f"Session write error: {e}")
+        return session_id
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load a session, or None if it doesn't exist"""
+        try:
+            path = self._get_session_path(session_id)
+        except ValueError:
+            return None
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error(f"Session read error: {e}")
+            return None
+
+
+# Singleton instance
+session_store = SessionStore()
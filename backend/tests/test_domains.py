@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+
+import domains
+from domains import DomainChecker, StubResolver, candidate_domains
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(domains, "time", fake)
+    return fake
+
+
+class SlowResolver(StubResolver):
+    """Stub resolver that holds every lookup until released"""
+
+    def __init__(self, taken=None):
+        super().__init__(taken)
+        self.release = asyncio.Event()
+
+    async def is_available(self, domain):
+        self.calls += 1
+        await self.release.wait()
+        return domain.lower() not in self.taken
+
+
+def test_candidate_domains_single_word():
+    assert candidate_domains("Atlas") == [
+        "atlas.com", "atlas.io", "atlas.ai", "getatlas.com", "tryatlas.com"
+    ]
+
+
+def test_candidate_domains_multi_word_and_camel_case():
+    expected = [
+        "nexuslabs.com", "nexuslabs.io", "nexuslabs.ai",
+        "nexus-labs.com", "getnexuslabs.com", "trynexuslabs.com"
+    ]
+    assert candidate_domains("Nexus Labs") == expected
+    assert candidate_domains("NexusLabs") == expected
+
+
+def test_candidate_domains_empty():
+    assert candidate_domains("!!!") == []
+
+
+@pytest.mark.parametrize("name, slug", [
+    ("Brío", "brio"),
+    ("Élan", "elan"),
+    ("Sól", "sol"),
+    ("Ōkami", "okami"),
+])
+def test_candidate_domains_fold_accents(name, slug):
+    assert candidate_domains(name)[0] == f"{slug}.com"
+
+
+@pytest.mark.parametrize("name", ["Straße", "Æther", "Sakura 桜"])
+def test_candidate_domains_unmappable(name):
+    assert candidate_domains(name) == []
+
+
+def test_results_are_cached_until_ttl(clock):
+    resolver = StubResolver(taken=["atlas.com"])
+    checker = DomainChecker(resolver, ttl=60)
+
+    async def run():
+        assert await checker.check_domain("atlas.com") is False
+        assert await checker.check_domain("ATLAS.com") is False
+        assert resolver.calls == 1
+
+        clock.now += 61
+        assert await checker.check_domain("atlas.com") is False
+        assert resolver.calls == 2
+
+    asyncio.run(run())
+
+
+def test_expired_entries_are_pruned(clock):
+    checker = DomainChecker(StubResolver(), ttl=60, prune_interval=300)
+
+    async def run():
+        await checker.check_domain("old.com")
+        clock.now += 400
+        await checker.check_domain("new.com")
+
+    asyncio.run(run())
+    assert list(checker._cache) == ["new.com"]
+
+
+def test_in_flight_lookups_are_shared(clock):
+    resolver = SlowResolver()
+    checker = DomainChecker(resolver)
+
+    async def run():
+        tasks = [asyncio.create_task(checker.check_domain("nova.io")) for _ in range(5)]
+        await asyncio.sleep(0)
+        resolver.release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(run()) == [True] * 5
+    assert resolver.calls == 1
+
+
+def test_annotate_generate_result(clock):
+    resolver = StubResolver(taken=["atlas.com"])
+    checker = DomainChecker(resolver)
+    result = {
+        "names": [
+            {"id": "n1", "name": "Atlas"},
+            {"id": "n2", "name": "Atlas"},
+        ],
+        "threads": [{"thread_id": 0, "title": "Titans", "name_ids": ["n1"]}]
+    }
+
+    annotated = asyncio.run(checker.annotate_generate_result(result))
+
+    assert annotated["threads"] == result["threads"]
+    assert "domains" not in result["names"][0]
+    first = annotated["names"][0]["domains"]
+    assert first[0] == {"domain": "atlas.com", "available": False}
+    assert all(d["available"] for d in first[1:])
+    assert annotated["names"][1]["domains"] == first
+    assert resolver.calls == len(first)
+
+
+def test_annotate_deeper_result(clock):
+    checker = DomainChecker(StubResolver(taken=["helios.io"]))
+    result = {
+        "source_name": "Hyperion",
+        "threads": [
+            {"dimension": "same_family", "title": "Same Family", "names": [{"id": "d1", "name": "Helios"}]},
+            {"dimension": "phonetic", "title": "Phonetic", "names": [{"id": "d2", "name": "Orion"}]},
+        ]
+    }
+
+    annotated = asyncio.run(checker.annotate_deeper_result(result))
+
+    helios = {d["domain"]: d["available"] for d in annotated["threads"][0]["names"][0]["domains"]}
+    assert helios["helios.io"] is False
+    assert helios["helios.com"] is True
+    orion = annotated["threads"][1]["names"][0]["domains"]
+    assert all(d["available"] for d in orion)
+
+
+def test_check_names_is_capped(clock, monkeypatch):
+    monkeypatch.setattr(domains, "MAX_NAMES", 2)
+    resolver = StubResolver()
+    checker = DomainChecker(resolver)
+    result = {"names": [{"id": f"n{i}", "name": name} for i, name in enumerate(["Atlas", "Atlas", "Orion", "Nova"])]}
+
+    annotated = asyncio.run(checker.annotate_generate_result(result))
+
+    assert [n["domains"] is not None for n in annotated["names"]] == [True, True, True, False]
+    assert resolver.calls == len(candidate_domains("Atlas")) + len(candidate_domains("Orion"))
+
+
+def test_domains_request_is_capped():
+    from pydantic import ValidationError
+    from models import DomainsRequest
+
+    assert len(DomainsRequest(names=["Atlas"] * domains.MAX_NAMES).names) == domains.MAX_NAMES
+    with pytest.raises(ValidationError):
+        DomainsRequest(names=["Atlas"] * (domains.MAX_NAMES + 1))
@@ -0,0 +1,108 @@
+import asyncio
+
+from explore import ExplorationSession
+from sessions import SessionStore
+
+
+class FakeGenerator:
+    """Yields fixed Go Deeper threads without calling Claude"""
+
+    async def go_deeper_stream(self, name, context="", dimensions=None):
+        for dimension, names in [("same_family", ["Helios", "Selene"]), ("phonetic", ["Orion"])]:
+            yield {
+                "dimension": dimension,
+                "title": dimension.replace("_", " ").title(),
+                "names": [{"id": n.lower(), "name": n} for n in names]
+            }
+
+
+def explore(session, name):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def run():
+        await session.handle({"type": "explore", "name": name}, send)
+        await session._task
+
+    asyncio.run(run())
+    return messages
+
+
+def test_resume_keeps_saved_generate_calls_and_favorites(tmp_path):
+    store = SessionStore(tmp_path)
+    session_id = store.save({
+        "generate": [{"prompt": "solar startup", "num_results": 20}],
+        "deeper": [],
+        "favorites": [{"id": "f1", "name": "Prometheus", "category": "mythology"}]
+    })
+
+    session = ExplorationSession(FakeGenerator(), store, session_id)
+    messages = explore(session, "Hyperion")
+
+    assert [m["type"] for m in messages] == ["thread", "thread", "done"]
+    saved = store.get(session_id)
+    assert saved["generate"] == [{"prompt": "solar startup", "num_results": 20}]
+    assert saved["favorites"] == [{"id": "f1", "name": "Prometheus", "category": "mythology"}]
+    assert [d["name"] for d in saved["deeper"]] == ["Hyperion"]
+    assert "helios" in saved["seen"]
+
+
+def test_seen_names_move_to_end_of_thread(tmp_path):
+    session = ExplorationSession(FakeGenerator(), SessionStore(tmp_path))
+    session.seen.add("helios")
+
+    messages = explore(session, "Hyperion")
+
+    assert [n["name"] for n in messages[0]["thread"]["names"]] == ["Selene", "Helios"]
+
+
+def test_context_change_mid_flight_keeps_explored_context(tmp_path):
+    class GatedGenerator(FakeGenerator):
+        def __init__(self):
+            self.release = asyncio.Event()
+            self.contexts = []
+
+        async def go_deeper_stream(self, name, context="", dimensions=None):
+            self.contexts.append(context)
+            await self.release.wait()
+            async for thread in super().go_deeper_stream(name, context, dimensions):
+                yield thread
+
+    generator = GatedGenerator()
+    session = ExplorationSession(generator, SessionStore(tmp_path))
+    session.context = "solar startup"
+
+    async def send(message):
+        pass
+
+    async def run():
+        await session.handle({"type": "explore", "name": "Hyperion"}, send)
+        await asyncio.sleep(0)
+        await session.handle({"type": "context", "context": "bakery"}, send)
+        generator.release.set()
+        await session._task
+
+    asyncio.run(run())
+
+    assert generator.contexts == ["solar startup"]
+    assert session.history[0]["context"] == "solar startup"
+    assert session.context == "bakery"
+
+
+def test_explore_rejects_invalid_dimensions(tmp_path):
+    session = ExplorationSession(FakeGenerator(), SessionStore(tmp_path))
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def run():
+        for dimensions in ["phonetic", [1, 2], {"phonetic": True}]:
+            await session.handle({"type": "explore", "name": "Hyperion", "dimensions": dimensions}, send)
+
+    asyncio.run(run())
+
+    assert [m["type"] for m in messages] == ["error"] * 3
+    assert session._task is None
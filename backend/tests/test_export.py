@@ -0,0 +1,125 @@
+import csv
+import io
+import json
+from xml.etree import ElementTree
+
+import pytest
+
+import cache
+import export
+from cache import ResponseCache
+from export import COLUMNS, export_lines, snapshot_session
+from generator import deeper_cache_key, generate_cache_key
+from graph import NameGraph
+
+SS = "{urn:schemas-microsoft-com:office:spreadsheet}"
+
+GENERATE_RESULT = {
+    "names": [
+        {"id": "n1", "name": "Atlas", "category": "mythology", "tags": ["strong", "classic"]},
+        {"id": "n2", "name": "Nexus", "category": None, "meaning": "Connection, <hub> & core"},
+    ],
+    "threads": [{"thread_id": 0, "title": "Titans", "name_ids": ["n1"]}]
+}
+
+DEEPER_RESULT = {
+    "source_name": "Atlas",
+    "threads": [{"dimension": "same_family", "title": "Same Family", "names": [{"id": "d1", "name": "Prometheus"}]}]
+}
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def response_cache(tmp_path, monkeypatch, clock):
+    response_cache = ResponseCache(tmp_path / "cache")
+    monkeypatch.setattr(export, "response_cache", response_cache)
+    monkeypatch.setattr(export, "name_graph", NameGraph(tmp_path / "graph.jsonl"))
+    return response_cache
+
+
+@pytest.fixture
+def session(response_cache, clock):
+    """A saved session whose cached results have since expired"""
+    generate = {"prompt": "Solar startup", "num_results": 10, "style": "professional", "categories": None}
+    deeper = {"name": "Atlas", "context": "solar startup", "dimensions": None}
+    response_cache.set(generate_cache_key("solar startup", 10, "professional"), GENERATE_RESULT, ttl=60)
+    response_cache.set(deeper_cache_key("Atlas", "solar startup"), DEEPER_RESULT, ttl=60)
+
+    saved = snapshot_session({
+        "generate": [generate],
+        # Never cached, so it has no snapshot and is skipped on export
+        "deeper": [deeper, {"name": "Helios", "context": "", "dimensions": None}],
+        "favorites": [{"id": "f1", "name": "Aurora", "category": "nature", "tags": ["dawn"]}]
+    })
+
+    clock.now += 61
+    assert export.response_cache.get(generate_cache_key("solar startup", 10, "professional")) is None
+    return saved
+
+
+def export_text(export_format, session):
+    return "".join(export_lines(
+        export_format,
+        generate=session["generate"],
+        deeper=session["deeper"],
+        favorites=session["favorites"]
+    ))
+
+
+EXPECTED = [
+    ("favorite", "Aurora", "dawn"),
+    ("generate", "Atlas", "strong;classic"),
+    ("generate", "Nexus", ""),
+    ("deeper", "Prometheus", ""),
+]
+
+
+def test_snapshot_attaches_cached_results(session):
+    assert session["generate"][0]["result"] == GENERATE_RESULT
+    assert session["deeper"][0]["result"] == DEEPER_RESULT
+    assert "result" not in session["deeper"][1]
+
+
+def test_csv_export_from_snapshot(session):
+    rows = list(csv.DictReader(io.StringIO(export_text("csv", session))))
+
+    assert [(r["source"], r["name"], r["tags"]) for r in rows] == EXPECTED
+    assert rows[1]["thread"] == "Titans"
+    assert rows[2]["meaning"] == "Connection, <hub> & core"
+
+
+def test_jsonl_export_keeps_tags_as_list(session):
+    rows = [json.loads(line) for line in export_text("jsonl", session).splitlines()]
+
+    assert [(r["source"], r["name"]) for r in rows] == [(s, n) for s, n, _ in EXPECTED]
+    assert rows[0]["tags"] == ["dawn"]
+    assert rows[1]["tags"] == ["strong", "classic"]
+    assert rows[2]["tags"] == []
+    assert rows[2]["category"] is None
+
+
+def test_spreadsheetml_export_from_snapshot(session):
+    workbook = ElementTree.fromstring(export_text("xls", session))
+    rows = [
+        [data.text or "" for data in row.iter(f"{SS}Data")]
+        for row in workbook.iter(f"{SS}Row")
+    ]
+
+    assert rows[0] == COLUMNS
+    records = [dict(zip(COLUMNS, row)) for row in rows[1:]]
+    assert [(r["source"], r["name"], r["tags"]) for r in records] == EXPECTED
+    assert records[2]["meaning"] == "Connection, <hub> & core"
@@ -0,0 +1,131 @@
+import json
+
+import pytest
+
+import graph
+from graph import MIN_DIMENSIONS, MIN_NAMES_PER_DIMENSION, NameGraph
+
+DIMENSIONS = ["same_family", "similar_meaning", "phonetic", "cross_cultural", "syllable_remix"]
+
+
+def deeper_result(source, dimensions=DIMENSIONS, per_dimension=MIN_NAMES_PER_DIMENSION, prefix=""):
+    return {
+        "source_name": source,
+        "threads": [
+            {
+                "dimension": dimension,
+                "title": dimension.replace("_", " ").title(),
+                "names": [
+                    {"id": f"{dimension}_{i}", "name": f"{prefix}{dimension.title()}{i}", "meaning": f"m{i}"}
+                    for i in range(per_dimension)
+                ]
+            }
+            for dimension in dimensions
+        ]
+    }
+
+
+@pytest.fixture
+def name_graph(tmp_path):
+    return NameGraph(tmp_path / "results.jsonl")
+
+
+def test_serves_result_once_enough_dimensions_are_filled(name_graph):
+    name_graph.add_deeper_result("Hyperion", deeper_result("Hyperion", DIMENSIONS[:MIN_DIMENSIONS]))
+
+    result = name_graph.as_deeper_result(" hyperion ")
+
+    assert result["source_name"] == "Hyperion"
+    assert [t["dimension"] for t in result["threads"]] == DIMENSIONS[:MIN_DIMENSIONS]
+    assert [n["name"] for n in result["threads"][0]["names"]] == ["Same_Family0", "Same_Family1", "Same_Family2"]
+
+
+def test_too_few_dimensions_or_names_is_not_served(name_graph):
+    name_graph.add_deeper_result("Hyperion", deeper_result("Hyperion", DIMENSIONS[:MIN_DIMENSIONS - 1]))
+    name_graph.add_deeper_result(
+        "Atlas", deeper_result("Atlas", DIMENSIONS, per_dimension=MIN_NAMES_PER_DIMENSION - 1)
+    )
+
+    assert name_graph.as_deeper_result("Hyperion") is None
+    assert name_graph.as_deeper_result("Atlas") is None
+
+
+def test_requested_dimensions_lower_the_requirement(name_graph):
+    name_graph.add_deeper_result("Hyperion", deeper_result("Hyperion", ["phonetic", "syllable_remix"]))
+
+    result = name_graph.as_deeper_result("Hyperion", dimensions=["phonetic"])
+    assert [t["dimension"] for t in result["threads"]] == ["phonetic"]
+
+    # Both requested dimensions must be filled
+    assert name_graph.as_deeper_result("Hyperion", dimensions=["phonetic", "same_family"]) is None
+
+
+def test_edges_are_scoped_by_context(name_graph):
+    name_graph.add_deeper_result("Hyperion", deeper_result("Hyperion"), context="Solar Startup ")
+
+    assert name_graph.as_deeper_result("Hyperion", context="solar startup") is not None
+    assert name_graph.as_deeper_result("Hyperion") is None
+    assert name_graph.as_deeper_result("Hyperion", context="bakery") is None
+    assert name_graph.neighborhood("Hyperion", context="bakery")["edges"] == []
+
+
+def test_symmetric_and_one_way_edges(name_graph):
+    name_graph.add_deeper_result("Hyperion", deeper_result("Hyperion", ["phonetic", "syllable_remix"], per_dimension=1))
+
+    back = name_graph.neighborhood("Phonetic0")
+    assert {(e["target"], e["dimension"]) for e in back["edges"]} == {("hyperion", "phonetic")}
+
+    remix = name_graph.neighborhood("Syllable_Remix0")
+    assert remix["edges"] == []
+    assert [n["id"] for n in remix["nodes"]] == ["syllable_remix0"]
+
+
+def test_neighborhood_respects_hops(name_graph):
+    name_graph.add_deeper_result("Hyperion", {"source_name": "Hyperion", "threads": [
+        {"dimension": "same_family", "names": [{"name": "Helios"}]}
+    ]})
+    name_graph.add_deeper_result("Helios", {"source_name": "Helios", "threads": [
+        {"dimension": "syllable_remix", "names": [{"name": "Heliox"}]}
+    ]})
+
+    def depths(hops):
+        return {n["id"]: n["depth"] for n in name_graph.neighborhood("Hyperion", hops=hops)["nodes"]}
+
+    assert depths(0) == {"hyperion": 0}
+    assert depths(1) == {"hyperion": 0, "helios": 1}
+    assert depths(2) == {"hyperion": 0, "helios": 1, "heliox": 2}
+    assert depths(10) == depths(graph.MAX_HOPS)
+
+    only_family = name_graph.neighborhood("Hyperion", hops=2, dimensions=["same_family"])
+    assert {n["id"] for n in only_family["nodes"]} == {"hyperion", "helios"}
+    assert name_graph.neighborhood("Unknown")["nodes"] == []
+
+
+def test_log_is_compacted_at_twice_max_results(tmp_path):
+    path = tmp_path / "results.jsonl"
+    name_graph = NameGraph(path, max_results=2)
+
+    for i in range(3):
+        name_graph.add_deeper_result(f"Name{i}", deeper_result(f"Name{i}", ["phonetic"], per_dimension=1))
+    assert len(path.read_text().splitlines()) == 3
+
+    name_graph.add_deeper_result("Name3", deeper_result("Name3", ["phonetic"], per_dimension=1))
+
+    assert [json.loads(line)["name"] for line in path.read_text().splitlines()] == ["Name2", "Name3"]
+    assert name_graph.get_stats()["total_results"] == 2
+    assert "name0" not in name_graph.nodes
+    assert "name3" in name_graph.nodes
+
+
+def test_reload_replays_log_and_skips_bad_lines(tmp_path):
+    path = tmp_path / "results.jsonl"
+    NameGraph(path).add_deeper_result("Hyperion", deeper_result("Hyperion"), context="solar")
+    with open(path, "a") as f:
+        f.write("not json\n")
+        f.write(json.dumps({"name": "Atlas", "result": {}}) + "\n")
+        f.write(json.dumps(["Atlas"]) + "\n")
+
+    reloaded = NameGraph(path)
+
+    assert reloaded.get_stats()["total_results"] == 1
+    assert reloaded.as_deeper_result("Hyperion", context="solar") is not None
@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+
+from ranking import (
+    DUPLICATE_THRESHOLD,
+    dedupe_indices,
+    mmr_order,
+    ngram_vectors,
+    process_deeper_result,
+    process_generate_result,
+    similarity_matrix,
+)
+
+
+def test_ngram_vectors_are_normalized():
+    vectors = ngram_vectors(["Atlas", "A", ""])
+    assert vectors.shape[0] == 3
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, rtol=1e-5)
+
+
+def test_similarity_ignores_case_and_whitespace():
+    sim = similarity_matrix(["Atlas", " atlas "])
+    assert sim[0, 1] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("a, b, duplicate", [
+    ("Lumina", "Luminar", True),
+    ("Aurora", "Auroria", False),
+    ("Helios", "Heliox", False),
+])
+def test_near_duplicate_threshold(a, b, duplicate):
+    sim = similarity_matrix([a, b])
+    assert bool(sim[0, 1] >= DUPLICATE_THRESHOLD) is duplicate
+    assert dedupe_indices(sim) == ([0] if duplicate else [0, 1])
+
+
+def test_dedupe_keeps_first_of_each_group():
+    sim = similarity_matrix(["Nexus", "Lumina", "nexus", "Luminar", "Orion"])
+    assert dedupe_indices(sim) == [0, 1, 4]
+
+
+def test_mmr_order_prefers_diverse_names():
+    # Without diversity the second near-identical name would come second
+    sim = similarity_matrix(["Solaris", "Solarix", "Orion"])
+    assert mmr_order(sim, lambda_=1.0) == [0, 1, 2]
+    assert mmr_order(sim, lambda_=0.5) == [0, 2, 1]
+    assert mmr_order(sim, limit=1) == [0]
+    assert mmr_order(sim, limit=0) == []
+
+
+def test_process_generate_result_filters_null_category():
+    result = {
+        "names": [
+            {"id": "n1", "name": "Atlas", "category": "mythology"},
+            {"id": "n2", "name": "Nexus", "category": None},
+            {"id": "n3", "name": "Quantum", "category": "Scientific"},
+            {"id": "n4", "name": "Zenith"},
+        ],
+        "threads": None
+    }
+
+    modern = process_generate_result(result, ["modern"])
+    assert [n["id"] for n in modern["names"]] == ["n2", "n4"]
+    scientific = process_generate_result(result, ["SCIENTIFIC"])
+    assert [n["id"] for n in scientific["names"]] == ["n3"]
+    assert modern["threads"] == []
+
+
+def test_process_generate_result_prunes_thread_name_ids():
+    result = {
+        "names": [
+            {"id": "n1", "name": "Lumina", "category": "nature"},
+            {"id": "n2", "name": "Luminar", "category": "nature"},
+            {"id": "n3", "name": "Atlas", "category": "mythology"},
+            {"id": "n4", "name": "Orion", "category": "mythology"},
+        ],
+        "threads": [
+            {"thread_id": 0, "title": "Light", "name_ids": ["n1", "n2"]},
+            {"thread_id": 1, "title": "Duplicates", "name_ids": ["n2"]},
+            {"thread_id": 2, "title": "Titans", "name_ids": ["n3", "n4"]},
+        ]
+    }
+
+    processed = process_generate_result(result, limit=3)
+
+    assert {n["id"] for n in processed["names"]} == {"n1", "n3", "n4"}
+    assert processed["threads"] == [
+        {"thread_id": 0, "title": "Light", "name_ids": ["n1"]},
+        {"thread_id": 2, "title": "Titans", "name_ids": ["n3", "n4"]},
+    ]
+    # The cached superset is left untouched
+    assert len(result["names"]) == 4
+    assert result["threads"][0]["name_ids"] == ["n1", "n2"]
+
+
+def test_process_generate_result_applies_limit():
+    result = {"names": [{"id": f"n{i}", "name": name} for i, name in enumerate(
+        ["Atlas", "Nexus", "Orion", "Zenith", "Helix"]
+    )]}
+    assert len(process_generate_result(result, limit=2)["names"]) == 2
+
+
+def test_process_deeper_result_dedupes_across_threads():
+    result = {
+        "source_name": "Hyperion",
+        "threads": [
+            {"dimension": "same_family", "names": [
+                {"id": "d1", "name": "Helios"},
+                {"id": "d2", "name": "hyperion"},
+                {"id": "d3", "name": "Lumina"},
+            ]},
+            {"dimension": "similar_meaning", "names": [
+                {"id": "d4", "name": "Luminar"},
+                {"id": "d5", "name": "Radiant"},
+            ]},
+            {"dimension": "phonetic", "names": [
+                {"id": "d6", "name": "HELIOS"},
+            ]},
+            {"dimension": "syllable_remix", "names": [
+                {"id": "d7", "name": "Hyperionix"},
+            ]},
+        ]
+    }
+
+    processed = process_deeper_result(result, "Hyperion")
+
+    ids = {t["dimension"]: sorted(n["id"] for n in t["names"]) for t in processed["threads"]}
+    assert ids == {
+        "same_family": ["d1", "d3"],
+        "similar_meaning": ["d5"],
+        # Remixes above the duplicate threshold against the source are kept
+        "syllable_remix": ["d7"],
+    }
+    assert processed["source_name"] == "Hyperion"
+
+
+def test_process_deeper_result_without_names():
+    result = {"source_name": "Atlas", "threads": []}
+    assert process_deeper_result(result, "Atlas") == result
+
+
+def test_process_deeper_result_only_source_name():
+    result = {"source_name": "Atlas", "threads": [{"dimension": "phonetic", "names": [{"id": "d1", "name": "atlas"}]}]}
+    assert process_deeper_result(result, "Atlas")["threads"] == []
@@ -0,0 +1,55 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from timing import server_timing_header, span, summarize
+from warmup import AccessHistory
+
+
+def test_summarize_aggregates_by_name():
+    summary = summarize([("cache_read", 1.5), ("upstream", 100.0), ("cache_read", 2.5)])
+    assert summary == {
+        "cache_read": {"dur": 4.0, "count": 2},
+        "upstream": {"dur": 100.0, "count": 1},
+    }
+
+
+def test_server_timing_header_format():
+    header = server_timing_header({"cache_read": {"dur": 4.0, "count": 2}}, 12.345)
+    assert header == 'cache_read;dur=4.0;desc="2x", total;dur=12.3'
+    assert server_timing_header({}, 0) == "total;dur=0.0"
+
+
+def test_span_outside_a_request_is_a_no_op():
+    with span("anything"):
+        pass
+
+
+def metric_names(header):
+    return [metric.split(";")[0] for metric in header.split(", ")]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # Fallback results only: no Claude calls and no shared access history
+    monkeypatch.setattr(main.name_generator, "client", None)
+    monkeypatch.setattr(main, "access_history", AccessHistory(tmp_path / "history.counts"))
+    return TestClient(main.app)
+
+
+def test_generate_reports_server_timing(client):
+    response = client.post("/api/generate", json={"prompt": "solar startup", "num_results": 5})
+
+    assert response.status_code == 200
+    assert response.json()["total_results"] == 5
+    names = metric_names(response.headers["server-timing"])
+    assert {"rank", "models", "serialize"} <= set(names)
+    assert names[-1] == "total"
+
+
+def test_deeper_reports_serialization(client):
+    response = client.post("/api/deeper", json={"name": "Hyperion"})
+
+    assert response.status_code == 200
+    assert response.json()["source_name"] == "Hyperion"
+    assert {"rank", "models", "serialize"} <= set(metric_names(response.headers["server-timing"]))
@@ -0,0 +1,126 @@
+import asyncio
+import json
+
+import pytest
+
+import warmup
+from warmup import AccessHistory, CacheWarmer
+
+
+class FakeGenerator:
+    """Generator that spends a fixed number of tokens per call"""
+
+    def __init__(self, tokens_per_call=100, delay=0.0):
+        self.tokens_per_call = tokens_per_call
+        self.delay = delay
+        self.tokens_used = 0
+        self.calls = []
+
+    def is_available(self):
+        return True
+
+    async def generate(self, prompt):
+        await asyncio.sleep(self.delay)
+        self.calls.append(("generate", prompt))
+        self.tokens_used += self.tokens_per_call
+        return {"names": [{"name": f"{prompt} one"}, {"name": f"{prompt} two"}]}
+
+    async def go_deeper(self, name, context):
+        await asyncio.sleep(self.delay)
+        self.calls.append(("deeper", name))
+        self.tokens_used += self.tokens_per_call
+        return {"source_name": name, "threads": []}
+
+
+@pytest.fixture
+def prompts(monkeypatch):
+    monkeypatch.setattr(warmup, "EXAMPLE_PROMPTS", ["alpha", "beta", "gamma"])
+
+
+@pytest.fixture
+def history(tmp_path):
+    return AccessHistory(tmp_path / "history.counts")
+
+
+def test_history_flushes_every_few_records(history, monkeypatch):
+    monkeypatch.setattr(warmup, "HISTORY_FLUSH_EVERY", 3)
+
+    history.record("Atlas")
+    history.record("  atlas ")
+    assert not history.path.exists()
+
+    history.record("Nova")
+    assert json.loads(history.path.read_text()) == {"atlas": 2, "nova": 1}
+    assert AccessHistory(history.path).top() == ["atlas", "nova"]
+
+
+def test_history_flush_keeps_most_requested(tmp_path):
+    history = AccessHistory(tmp_path / "history.counts", max_prompts=2)
+    for prompt, count in [("a", 3), ("b", 1), ("c", 2)]:
+        for _ in range(count):
+            history.record(prompt)
+
+    history.flush()
+
+    assert json.loads(history.path.read_text()) == {"a": 3, "c": 2}
+    assert history.top(5) == ["a", "c"]
+
+
+def test_history_skips_malformed_counts(history):
+    history.path.write_text(json.dumps({"atlas": 2, "nova": "many", "helix": None}))
+    assert history.top() == ["atlas"]
+
+    history.path.write_text("[1, 2]")
+    assert AccessHistory(history.path).top() == []
+
+
+def test_warm_counts_budget_skips(history, prompts):
+    generator = FakeGenerator(tokens_per_call=100)
+    warmer = CacheWarmer(generator, history, concurrency=1, token_budget=250, deeper_per_prompt=2)
+
+    status = asyncio.run(warmer.warm())
+
+    # Three generates spend 300 tokens, so every Go Deeper is skipped
+    assert status["state"] == "ready"
+    assert [kind for kind, _ in generator.calls] == ["generate"] * 3
+    assert status["completed"] == 3
+    assert status["skipped"] == 6
+    assert status["total"] == 9
+    assert status["tokens_spent"] == 300
+    assert warmer.is_ready
+
+
+def test_warm_counts_failed_calls(history, prompts):
+    generator = FakeGenerator()
+
+    async def broken(name, context):
+        raise RuntimeError("upstream down")
+
+    generator.go_deeper = broken
+    status = asyncio.run(CacheWarmer(generator, history, deeper_per_prompt=1).warm())
+
+    assert status["state"] == "ready"
+    assert status["failed"] == 3
+    assert status["completed"] == 6
+
+
+def test_warm_stops_at_max_duration(history, prompts):
+    warmer = CacheWarmer(FakeGenerator(delay=10), history, max_duration=0.05)
+
+    status = asyncio.run(warmer.warm())
+
+    assert status["state"] == "timed_out"
+    assert warmer.is_ready
+
+
+def test_warm_ends_ready_on_unexpected_error(history, prompts):
+    warmer = CacheWarmer(FakeGenerator(), history)
+
+    def broken(n=None):
+        raise TypeError("bad history")
+
+    history.top = broken
+    status = asyncio.run(warmer.warm())
+
+    assert status["state"] == "failed"
+    assert warmer.is_ready
@@ -0,0 +1,174 @@
+"""
+Request timing for Fission API
+Span instrumentation emitted as Server-Timing headers and structured logs,
+with an opt-in sampling profiler for slow requests
+"""
+
+import os
+import json
+import time
+import random
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterator
+
+logger = logging.getLogger(__name__)
+
+PROFILES_DIR = Path(__file__).parent / ".cache" / "profiles"
+
+_spans: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("fission_spans", default=None)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a block and attribute it to the current request
+
+    Works in sync and async code alike; outside a request it only costs
+    a context variable lookup.
+
+    Args:
+        name: Metric name for the Server-Timing header (a token, e.g. "cache_read")
+    """
+    spans = _spans.get()
+    if spans is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        spans.append((name, (time.perf_counter() - start) * 1000))
+
+
+def summarize(spans: List[Tuple[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Aggregate spans by name into total duration (ms) and call count"""
+    summary: Dict[str, Dict[str, float]] = {}
+    for name, duration in spans:
+        entry = summary.setdefault(name, {"dur": 0.0, "count": 0})
+        entry["dur"] += duration
+        entry["count"] += 1
+    return summary
+
+
+def server_timing_header(summary: Dict[str, Dict[str, float]], total_ms: float) -> str:
+    """Format a Server-Timing header value"""
+    metrics = [
+        f'{name};dur={entry["dur"]:.1f};desc="{entry["count"]}x"'
+        for name, entry in summary.items()
+    ]
+    metrics.append(f"total;dur={total_ms:.1f}")
+    return ", ".join(metrics)
+
+
+class _Profiler:
+    """Thin wrapper around pyinstrument, which is an optional dependency"""
+
+    def __init__(self, threshold_ms: float, sample_rate: float, profiles_dir: Path = PROFILES_DIR):
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self.profiles_dir = profiles_dir
+        try:
+            from pyinstrument import Profiler
+            self._profiler_cls = Profiler
+            logger.info(f"Profiling requests slower than {threshold_ms:.0f}ms (sample rate {sample_rate})")
+        except ImportError:
+            self._profiler_cls = None
+            logger.warning("FISSION_PROFILE_THRESHOLD_MS set but pyinstrument is not installed - profiling disabled")
+
+    def start(self) -> Any:
+        if self._profiler_cls is None or random.random() >= self.sample_rate:
+            return None
+        profiler = self._profiler_cls(interval=0.001, async_mode="enabled")
+        try:
+            profiler.start()
+        except RuntimeError as e:
+            # pyinstrument refuses to nest profilers in one context
+            logger.warning(f"Profiler not started: {e}")
+            return None
+        return profiler
+
+    def stop(self, profiler: Any, path: str, total_ms: float):
+        profiler.stop()
+        if total_ms < self.threshold_ms:
+            return
+        try:
+            self.profiles_dir.mkdir(parents=True, exist_ok=True)
+            slug = path.strip("/").replace("/", "_") or "root"
+            out = self.profiles_dir / f"{int(time.time() * 1000)}-{slug}.html"
+            out.write_text(profiler.output_html())
+            logger.info(f"Saved flame graph for {path} ({total_ms:.0f}ms) to {out}")
+        except Exception as e:
+            logger.error(f"Profile write error: {e}")
+
+
+def _create_profiler() -> Optional[_Profiler]:
+    """Enable profiling when FISSION_PROFILE_THRESHOLD_MS is set"""
+    threshold = os.getenv("FISSION_PROFILE_THRESHOLD_MS")
+    if not threshold:
+        return None
+    sample_rate = float(os.getenv("FISSION_PROFILE_SAMPLE_RATE", "1.0"))
+    return _Profiler(float(threshold), sample_rate)
+
+
+class TimingMiddleware:
+    """
+    ASGI middleware adding a Server-Timing header and a structured log
+    record to every HTTP response
+
+    Written as plain ASGI (not BaseHTTPMiddleware) so the route runs in
+    the same task and context as the span collector and profiler. For
+    streamed responses the timing covers everything up to the first byte.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+        self.profiler = _create_profiler()
+        self.log = logging.getLogger("fission.timing")
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        spans: List[Tuple[str, float]] = []
+        token = _spans.set(spans)
+        profiler = self.profiler.start() if self.profiler else None
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Dict[str, Any]):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                total_ms = (time.perf_counter() - start) * 1000
+                header = server_timing_header(summarize(spans), total_ms)
+                message = {
+                    **message,
+                    "headers": list(message.get("headers", [])) + [
+                        (b"server-timing", header.encode("latin-1")),
+                        (b"timing-allow-origin", b"*"),
+                    ]
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            total_ms = (time.perf_counter() - start) * 1000
+            _spans.reset(token)
+            if profiler is not None:
+                self.profiler.stop(profiler, scope["path"], total_ms)
+            self.log.info(json.dumps({
+                "event": "request_timing",
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status,
+                "total_ms": round(total_ms, 1),
+                "spans": {
+                    name: {"dur_ms": round(entry["dur"], 1), "count": entry["count"]}
+                    for name, entry in summarize(spans).items()
+                }
+            }))
@@ -0,0 +1,263 @@
+"""
+Cache warm-up for Fission API
+Precomputes generate/go_deeper results for example and popular prompts
+"""
+
+import json
+import time
+import asyncio
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from cache import CACHE_DIR
+from prompts import EXAMPLE_PROMPTS
+
+logger = logging.getLogger(__name__)
+
+HISTORY_PATH = CACHE_DIR / "access_history.counts"
+HISTORY_FLUSH_EVERY = 20
+MAX_HISTORY_PROMPTS = 1000
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TOKEN_BUDGET = 200_000
+DEFAULT_TOP_PROMPTS = 10
+DEFAULT_DEEPER_PER_PROMPT = 3
+DEFAULT_MAX_DURATION = 180  # Seconds before the instance reports ready regardless
+
+
+class AccessHistory:
+    """Request counts per prompt, used to find the hot set"""
+
+    def __init__(self, path: Path = HISTORY_PATH, max_prompts: int = MAX_HISTORY_PROMPTS):
+        self.path = path
+        self.max_prompts = max_prompts
+        self._counts: Optional[Counter] = None
+        self._unsaved = 0
+
+    def _load(self) -> Counter:
+        """Load the counts from disk on first use"""
+        if self._counts is None:
+            self._counts = Counter()
+            if self.path.exists():
+                try:
+                    with open(self.path, 'r') as f:
+                        counts = json.load(f)
+                    # Skip malformed entries; they would break most_common()
+                    self._counts.update({
+                        prompt: count for prompt, count in counts.items()
+                        if isinstance(count, int) and not isinstance(count, bool)
+                    })
+                except (json.JSONDecodeError, IOError, AttributeError, TypeError, ValueError) as e:
+                    logger.error(f"Access history read error: {e}")
+        return self._counts
+
+    def record(self, prompt: str):
+        """Count a single generate request; written to disk every few requests"""
+        prompt = prompt.lower().strip()
+        if not prompt:
+            return
+        self._load()[prompt] += 1
+        self._unsaved += 1
+        if self._unsaved >= HISTORY_FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        """Write the counts, keeping only the most-requested prompts"""
+        counts = self._load()
+        if len(counts) > self.max_prompts:
+            self._counts = counts = Counter(dict(counts.most_common(self.max_prompts)))
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(counts, f)
+            self._unsaved = 0
+        except IOError as e:
+            logger.error(f"Access history write error: {e}")
+
+    def top(self, n: int = DEFAULT_TOP_PROMPTS) -> List[str]:
+        """
+        Get the most-requested prompts
+
+        Args:
+            n: Number of prompts to return
+
+        Returns:
+            Prompts ordered by request count, most frequent first
+        """
+        return [prompt for prompt, _ in self._load().most_common(n)]
+
+
+class CacheWarmer:
+    """Precomputes the hot set of generate and go_deeper results"""
+
+    def __init__(
+        self,
+        generator: Any,
+        history: AccessHistory,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        top_prompts: int = DEFAULT_TOP_PROMPTS,
+        deeper_per_prompt: int = DEFAULT_DEEPER_PER_PROMPT,
+        max_duration: float = DEFAULT_MAX_DURATION
+    ):
+        self.generator = generator
+        self.history = history
+        self.concurrency = concurrency
+        self.token_budget = token_budget
+        self.top_prompts = top_prompts
+        self.deeper_per_prompt = deeper_per_prompt
+        self.max_duration = max_duration
+
+        self.state = "idle"  # idle, warming, ready, skipped, timed_out, failed
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.tokens_spent = 0
+        self._tokens_at_start = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """True once warm-up has ended, however it ended"""
+        return self.state not in ("idle", "warming")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get warm-up progress for the health endpoint"""
+        return {
+            "state": self.state,
+            "completed": self.completed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "total": self.total,
+            "tokens_spent": self.tokens_spent,
+            "token_budget": self.token_budget
+        }
+
+    def hot_prompts(self) -> List[str]:
+        """Example prompts followed by the most-requested prompts, deduplicated"""
+        seen = set()
+        prompts = []
+        for prompt in list(EXAMPLE_PROMPTS) + self.history.top(self.top_prompts):
+            key = prompt.lower().strip()
+            if key and key not in seen:
+                seen.add(key)
+                prompts.append(prompt)
+        return prompts
+
+    def _budget_exhausted(self) -> bool:
+        self.tokens_spent = self.generator.tokens_used - self._tokens_at_start
+        return self.tokens_spent >= self.token_budget
+
+    async def _run(self, semaphore: asyncio.Semaphore, coro_fn, *args) -> Optional[Dict[str, Any]]:
+        """Run one warm-up call under the concurrency limit and token budget"""
+        async with semaphore:
+            if self._budget_exhausted():
+                self.skipped += 1
+                return None
+            try:
+                return await coro_fn(*args)
+            except Exception as e:
+                logger.error(f"Warm-up call failed: {e}")
+                self.failed += 1
+                return None
+            finally:
+                self.completed += 1
+                self._budget_exhausted()
+
+    async def warm(self) -> Dict[str, Any]:
+        """
+        Warm the cache
+
+        Generates every hot prompt, then runs Go Deeper on the first
+        names of each result using the prompt as context (matching the
+        cache keys the frontend produces). Warm-up always ends in a ready
+        state: calls still running after max_duration are cancelled
+        ("timed_out"), and unexpected errors end it as "failed".
+
+        Returns:
+            Final warm-up status
+        """
+        if not self.generator.is_available():
+            logger.info("Claude unavailable - skipping cache warm-up")
+            self.state = "skipped"
+            return self.get_status()
+
+        self.state = "warming"
+        self._tokens_at_start = self.generator.tokens_used
+        started = time.time()
+        try:
+            await asyncio.wait_for(self._warm(), timeout=self.max_duration)
+            self.state = "ready"
+        except asyncio.TimeoutError:
+            logger.warning(f"Cache warm-up stopped after {self.max_duration:.0f}s")
+            self.state = "timed_out"
+        except Exception as e:
+            logger.error(f"Cache warm-up failed: {e}")
+            self.state = "failed"
+        finally:
+            if self.state == "warming":  # Cancelled
+                self.state = "failed"
+
+        logger.info(
+            f"Cache warm-up {self.state} in {time.time() - started:.1f}s "
+            f"({self.completed}/{self.total} calls, {self.skipped} skipped by budget, "
+            f"{self.tokens_spent} tokens)"
+        )
+        return self.get_status()
+
+    async def _warm(self):
+        """Generate the hot prompts, then Go Deeper on the first names of each"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        prompts = self.hot_prompts()
+        self.total = len(prompts)
+        logger.info(f"Warming cache for {len(prompts)} prompts (concurrency={self.concurrency})")
+
+        results = await asyncio.gather(*[
+            self._run(semaphore, self.generator.generate, prompt)
+            for prompt in prompts
+        ])
+
+        deeper_jobs = []
+        for prompt, result in zip(prompts, results):
+            if not result:
+                continue
+            for n in result.get("names", [])[:self.deeper_per_prompt]:
+                if n.get("name"):
+                    deeper_jobs.append((n["name"], prompt))
+
+        self.total += len(deeper_jobs)
+        await asyncio.gather(*[
+            self._run(semaphore, self.generator.go_deeper, name, prompt)
+            for name, prompt in deeper_jobs
+        ])
+
+
+# Singleton instance
+access_history = AccessHistory()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from generator import name_generator
+
+    parser = argparse.ArgumentParser(description="Warm the Fission response cache")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--token-budget", type=int, default=DEFAULT_TOKEN_BUDGET)
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_PROMPTS)
+    parser.add_argument("--deeper", type=int, default=DEFAULT_DEEPER_PER_PROMPT)
+    parser.add_argument("--max-duration", type=float, default=DEFAULT_MAX_DURATION)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    warmer = CacheWarmer(
+        name_generator,
+        access_history,
+        concurrency=args.concurrency,
+        token_budget=args.token_budget,
+        top_prompts=args.top,
+        deeper_per_prompt=args.deeper,
+        max_duration=args.max_duration
+    )
+    print(json.dumps(asyncio.run(warmer.warm()), indent=2))
@@ -51,6 +51,61 @@ class ApiService {
     }
   }
 
+  /**
+   * Get the k-hop neighborhood of a name from the server-side exploration graph
+   */
+  async getGraph(name, context = '', hops = 1, dimensions = null) {
+    try {
+      const response = await this.client.get('/api/graph', {
+        params: { name, context, hops, dimensions },
+        paramsSerializer: { indexes: null },
+      })
+      return response.data
+    } catch (error) {
+      console.error('Graph error:', error)
+      throw error
+    }
+  }
+
+  /**
+   * Open a WebSocket exploration channel; the server holds context,
+   * history and seen names, and pushes Go Deeper threads as they complete
+   */
+  openExploreChannel(sessionId = null) {
+    const url = new URL('/api/ws/explore', API_BASE_URL)
+    url.protocol = url.protocol.replace('http', 'ws')
+    if (sessionId) url.searchParams.set('session_id', sessionId)
+    return new WebSocket(url)
+  }
+
+  /**
+   * Save an exploration session (generate/deeper calls and favorites)
+   */
+  async saveSession(session) {
+    try {
+      const response = await this.client.post('/api/sessions', session)
+      return response.data
+    } catch (error) {
+      console.error('Save session error:', error)
+      throw error
+    }
+  }
+
+  /**
+   * Get a server-side export (csv, jsonl or xls) of cached results and favorites
+   */
+  async exportNames(request) {
+    try {
+      const response = await this.client.post('/api/export', request, {
+        responseType: 'blob',
+      })
+      return response.data
+    } catch (error) {
+      console.error('Export error:', error)
+      throw error
+    }
+  }
+
   /**
    * Get available categories for filtering
    */